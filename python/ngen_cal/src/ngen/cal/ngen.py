@@ -1,36 +1,40 @@
 from __future__ import annotations
 
 from pydantic import FilePath, root_validator, BaseModel, Field
-from typing import Optional, Sequence, Mapping, Union
+from typing import Optional, Sequence, Mapping, Union, Collection, TYPE_CHECKING
 try: #to get literal in python 3.7, it was added to typing in 3.8
     from typing import Literal
 except ImportError:
     from typing_extensions import Literal
 from pathlib import Path
-import logging
 import warnings
-#supress geopandas debug logs
-logging.disable(logging.DEBUG)
-import json
 import enum
-json.encoder.FLOAT_REPR = str #lambda x: format(x, '%.09f')
-import geopandas as gpd
+import orjson
+import numpy as np
 import pandas as pd
 import shutil
 from enum import Enum
 import re
 import os
+import functools
+import operator
 from ngen.config.realization import NgenRealization, Realization, CatchmentRealization
 from ngen.config.multi import MultiBMI
 from .model import ModelExec, PosInt, Configurable
 from .parameter import Parameter, Parameters
 from .calibration_cathment import CalibrationCatchment, AdjustableCatchment
 from .calibration_set import CalibrationSet, UniformCalibrationSet
+from .ngen_hooks.ngen_output import TrouteOutput
+from .ngen_hooks.observations import UsgsObservations
+from .utils import disable_logging
 #HyFeatures components
 from hypy.hydrolocation import NWISLocation
 from hypy.nexus import Nexus
 from hypy.catchment import Catchment
 
+if TYPE_CHECKING:
+    import geopandas as gpd
+
 
 class NgenStrategy(str, Enum):
     """
@@ -40,30 +44,35 @@ class NgenStrategy(str, Enum):
     explicit = "explicit"
     independent = "independent"
 
+# `Parameter` fields in the order of the columns produced by `_params_as_df`
+_param_record = operator.attrgetter('name', 'min', 'max', 'init', 'scale')
+_param_columns = ['param', 'min', 'max', 'init', 'scale']
+
+def _params_frame(params: Mapping[str, Parameters], names: Sequence[str]) -> pd.DataFrame:
+    """Build a single parameter frame for each model in `names` with a `model` column
+    recording which model each parameter belongs to.
+    """
+    rows = []
+    counts = []
+    for name in names:
+        p = params.get(name, [])
+        rows.extend(map(_param_record, p))
+        counts.append(len(p))
+    df = pd.DataFrame.from_records(rows, columns=_param_columns)
+    df['model'] = np.repeat(list(names), counts)
+    if not rows:
+        return df
+    # Copy the parameter column and use it as the index
+    # The param -> model relation has to be maintained for writing back
+    # to specific model components later
+    df['p'] = df['param']
+    return df.set_index('p')
+
 def _params_as_df(params: Mapping[str, Parameters], name: str = None):
     if not name:
-        dfs = []
-        for k,v in params.items():
-            df = pd.DataFrame([s.__dict__ for s in v])
-            df['model'] = k
-            df.rename(columns={'name':'param'}, inplace=True)
-            dfs.append(df)
-        df = pd.concat(dfs)
-        # Copy the parameter column and use it as the index
-        # The param -> model relation has to be maintained for writing back
-        # to specific model components later
-        df['p'] = df['param']
-        return df.set_index('p')
+        return _params_frame(params, list(params.keys()))
     else:
-        p = params.get(name, [])
-        df = pd.DataFrame([s.__dict__ for s in p])
-        df['model'] = name
-        df.rename(columns={'name':'param'}, inplace=True)
-        if p:
-            df['p'] = df['param']
-            return df.set_index('p')
-        else:
-            return df
+        return _params_frame(params, [name])
 
 def _map_params_to_realization(params: Mapping[str, Parameters], realization: Realization):
     # Since params are mapped by model name, we can track the model/param relationship
@@ -75,10 +84,7 @@ def _map_params_to_realization(params: Mapping[str, Parameters], realization: Re
     module = realization.formulations[0].params
 
     if isinstance(module, MultiBMI):
-        dfs = []
-        for m in module.modules:
-            dfs.append(_params_as_df(params, m.params.model_name))
-        return pd.concat(dfs)
+        return _params_frame(params, [m.params.model_name for m in module.modules])
     else:
         return _params_as_df(params, module.model_name)
 
@@ -100,6 +106,15 @@ class _HFVersion(enum.Enum):
     HF_2_1 = enum.auto()
     HF_2_2 = enum.auto()
 
+@functools.lru_cache(maxsize=None)
+def _hf_version_cached(hydrofabric: str, mtime: float) -> _HFVersion:
+    """Memoized `NgenBase._hf_version`.
+
+    `mtime` is only used as part of the cache key so a hydrofabric that is
+    modified in place is probed again.
+    """
+    return NgenBase._hf_version(Path(hydrofabric))
+
 class NgenBase(ModelExec):
     """
         Data class specific for Ngen
@@ -132,8 +147,10 @@ class NgenBase(ModelExec):
     _catchments: Sequence[CalibrationCatchment] = []
     _catchment_hydro_fabric: gpd.GeoDataFrame
     _nexus_hydro_fabric: gpd.GeoDataFrame
-    _flowpath_hydro_fabric: gpd.GeoDataFrame
+    _flowpath_hydro_fabric: pd.DataFrame
     _x_walk: pd.Series
+    # calibration id -> (parameter index, model -> parameter row positions)
+    _param_groups: dict = {}
 
     class Config:
         """Override configuration for pydantic BaseModel
@@ -147,33 +164,34 @@ class NgenBase(ModelExec):
         super().__init__(**kwargs)
         #now we work ours
         #Make a copy of the config file, just in case
-        shutil.copy(self.realization, str(self.realization)+'_original')
+        #skip the copy if an up to date backup is already present
+        backup = Path(str(self.realization)+'_original')
+        if not backup.exists() or backup.stat().st_mtime < Path(self.realization).stat().st_mtime:
+            shutil.copy(self.realization, backup)
 
         self._register_default_ngen_plugins()
 
         # Read the catchment hydrofabric data
-        if self.hydrofabric is not None:
-            hf_version = self._hf_version(self.hydrofabric)
-            if hf_version == _HFVersion.HF_2_0:
-                self._read_legacy_gpkg_hydrofabric()
-            elif hf_version == _HFVersion.HF_2_1:
-                self._read_gpkg_hydrofabric_2_1()
-            elif hf_version == _HFVersion.HF_2_2:
-                self._read_gpkg_hydrofabric_2_2()
+        #supress geopandas debug logs while reading
+        with disable_logging():
+            if self.hydrofabric is not None:
+                hf_version = _hf_version_cached(str(self.hydrofabric), os.path.getmtime(self.hydrofabric))
+                if hf_version == _HFVersion.HF_2_0:
+                    self._read_legacy_gpkg_hydrofabric()
+                elif hf_version == _HFVersion.HF_2_1:
+                    self._read_gpkg_hydrofabric_2_1()
+                elif hf_version == _HFVersion.HF_2_2:
+                    self._read_gpkg_hydrofabric_2_2()
+                else:
+                    raise RuntimeError("unreachable")
             else:
-                raise RuntimeError("unreachable")
-        else:
-            self._read_legacy_geojson_hydrofabric()
+                self._read_legacy_geojson_hydrofabric()
 
         #Read the calibration specific info
-        with open(self.realization) as fp:
-            data = json.load(fp)
+        data = orjson.loads(Path(self.realization).read_bytes())
         self.ngen_realization = NgenRealization(**data)
 
     def _register_default_ngen_plugins(self):
-        from .ngen_hooks.ngen_output import TrouteOutput
-        from .ngen_hooks.observations import UsgsObservations
-
         # t-route outputs
         self._plugin_manager.register(TrouteOutput(self.routing_output))
         # observations
@@ -183,15 +201,17 @@ class NgenBase(ModelExec):
     def _hf_version(hydrofabric: Path) -> _HFVersion:
         """Detect HF version using table schema. Raise KeyError if unsuccessful."""
         import sqlite3
-        connection = sqlite3.connect(hydrofabric)
-        query = "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'flow%';"
+        # open read only; the schema probe never writes and this avoids taking a write lock
+        connection = sqlite3.connect(f"{Path(hydrofabric).resolve().as_uri()}?mode=ro", uri=True)
+        # exact name match lets sqlite use the sqlite_master index rather than a LIKE scan
+        query = "SELECT name FROM sqlite_master WHERE type='table' AND name IN ('flowpaths', 'flowlines', 'flowpath_attributes', 'flowpath-attributes');"
         try:
             cursor = connection.execute(query)
             values = cursor.fetchall()
             values = set(map(lambda v: v[0], values))
         finally:
             connection.close()
-        assert len(values) >= 2, "expect at least two table names that start with 'flow'"
+        assert len(values) >= 2, "expect at least two flowpath related table names"
         # hydrofabric <= 2.1 use 'flowpaths' AND 'flowpath_attributes'
         # hydrofabric >= 2.1; < 2.2 use 'flowlines' AND 'flowpath-attributes'
         # hydrofabric >= 2.2 use 'flowpaths' AND 'flowpath-attributes'
@@ -204,66 +224,97 @@ class NgenBase(ModelExec):
         else:
             raise KeyError(f"could not determine HF version. debug information: {values!s}")
 
-    def _read_gpkg_hydrofabric_2_2(self) -> None:
-        # Read geopackage hydrofabric
-        self._catchment_hydro_fabric = gpd.read_file(self.hydrofabric, layer='divides')
-        self._catchment_hydro_fabric.set_index('divide_id', inplace=True)
+    def _read_gpkg_layers(self, layers: Mapping[str, Optional[Sequence[str]]], attribute_layers: Collection[str] = ()) -> dict[str, Union[gpd.GeoDataFrame, pd.DataFrame]]:
+        """Read a set of layers from the geopackage hydrofabric.
 
-        self._nexus_hydro_fabric = gpd.read_file(self.hydrofabric, layer='nexus')
-        self._nexus_hydro_fabric.set_index('id', inplace=True)
-
-        # hydrofabric >= 2.2 use 'flowpaths'
-        self._flowpath_hydro_fabric = gpd.read_file(self.hydrofabric, layer='flowpaths')
-        self._flowpath_hydro_fabric.set_index('id', inplace=True)
+        Args:
+            layers (Mapping[str, Optional[Sequence[str]]]): layer name to the columns to read from it,
+                                                            None reads all columns
+            attribute_layers (Collection[str]): layers whose geometry is not needed, these are
+                                                read as plain DataFrames without parsing geometries
 
-        # hydrofabric > 2.1 use 'flowpath-attributes'
-        attributes = gpd.read_file(self.hydrofabric, layer="flowpath-attributes")
-        attributes.set_index("id", inplace=True)
+        Returns:
+            dict[str, Union[gpd.GeoDataFrame, pd.DataFrame]]: layer name to layer data
+        """
+        # NOTE: geopandas is imported lazily, it is slow to import and only needed to read the hydrofabric
+        import geopandas as gpd
+        return {
+            layer: gpd.read_file(
+                self.hydrofabric,
+                layer=layer,
+                engine="pyogrio",
+                use_arrow=True,
+                columns=columns,
+                ignore_geometry=layer in attribute_layers,
+            )
+            for layer, columns in layers.items()
+        }
 
-        # hydrofabric >= 2.2 uses 'gage' instead of 'rl_gages'
-        self._x_walk = attributes.loc[attributes['gage'].notna(), 'gage']
+    def _set_gpkg_hydrofabric(self, layers: dict[str, Union[gpd.GeoDataFrame, pd.DataFrame]], flowpaths: str, attributes: str, gage: str) -> None:
+        """Assign the hydrofabric frames from layers read by `_read_gpkg_layers`.
 
-    def _read_gpkg_hydrofabric_2_1(self) -> None:
-        # Read geopackage hydrofabric
-        self._catchment_hydro_fabric = gpd.read_file(self.hydrofabric, layer='divides')
+        Args:
+            layers (dict[str, Union[gpd.GeoDataFrame, pd.DataFrame]]): layer name to layer data
+            flowpaths (str): name of the flowpath layer
+            attributes (str): name of the flowpath attributes layer
+            gage (str): name of the gage column in the flowpath attributes layer
+        """
+        self._catchment_hydro_fabric = layers['divides']
         self._catchment_hydro_fabric.set_index('divide_id', inplace=True)
 
-        self._nexus_hydro_fabric = gpd.read_file(self.hydrofabric, layer='nexus')
+        self._nexus_hydro_fabric = layers['nexus']
         self._nexus_hydro_fabric.set_index('id', inplace=True)
 
-        # hydrofabric > 2.1 use 'flowlines'
-        self._flowpath_hydro_fabric = gpd.read_file(self.hydrofabric, layer='flowlines')
+        self._flowpath_hydro_fabric = layers[flowpaths]
         self._flowpath_hydro_fabric.set_index('id', inplace=True)
 
-        # hydrofabric > 2.1 use 'flowpath-attributes'
-        attributes = gpd.read_file(self.hydrofabric, layer="flowpath-attributes")
+        attributes = layers[attributes]
         attributes.set_index("id", inplace=True)
 
-        self._x_walk = pd.Series( attributes[ ~ attributes['rl_gages'].isna() ]['rl_gages'] )
+        self._x_walk = attributes[gage].dropna()
 
-    def _read_legacy_gpkg_hydrofabric(self) -> None:
+    def _read_gpkg_hydrofabric_2_2(self) -> None:
         # Read geopackage hydrofabric
-        self._catchment_hydro_fabric = gpd.read_file(self.hydrofabric, layer='divides')
-        self._catchment_hydro_fabric.set_index('divide_id', inplace=True)
-
-        self._nexus_hydro_fabric = gpd.read_file(self.hydrofabric, layer='nexus')
-        self._nexus_hydro_fabric.set_index('id', inplace=True)
-
-        # hydrofabric <= 2.1 use 'flowpaths'
-        self._flowpath_hydro_fabric = gpd.read_file(self.hydrofabric, layer='flowpaths')
-        self._flowpath_hydro_fabric.set_index('id', inplace=True)
+        # hydrofabric >= 2.2 use 'flowpaths' and 'flowpath-attributes'
+        # hydrofabric >= 2.2 uses 'gage' instead of 'rl_gages'
+        # flowpaths are only used for their `toid` and the attributes for the gage crosswalk,
+        # so skip the remaining columns and their geometries
+        layers = self._read_gpkg_layers({
+            'divides': None,
+            'nexus': None,
+            'flowpaths': ['id', 'toid'],
+            'flowpath-attributes': ['id', 'gage'],
+        }, attribute_layers={'flowpaths', 'flowpath-attributes'})
+        self._set_gpkg_hydrofabric(layers, 'flowpaths', 'flowpath-attributes', 'gage')
 
-        # hydrofabric <= 2.1 use 'flowpath_attributes'
-        attributes = gpd.read_file(self.hydrofabric, layer="flowpath_attributes")
-        attributes.set_index("id", inplace=True)
+    def _read_gpkg_hydrofabric_2_1(self) -> None:
+        # Read geopackage hydrofabric
+        # hydrofabric > 2.1 use 'flowlines' and 'flowpath-attributes'
+        layers = self._read_gpkg_layers({
+            'divides': None,
+            'nexus': None,
+            'flowlines': ['id', 'toid'],
+            'flowpath-attributes': ['id', 'rl_gages'],
+        }, attribute_layers={'flowlines', 'flowpath-attributes'})
+        self._set_gpkg_hydrofabric(layers, 'flowlines', 'flowpath-attributes', 'rl_gages')
 
-        self._x_walk = pd.Series( attributes[ ~ attributes['rl_gages'].isna() ]['rl_gages'] )
+    def _read_legacy_gpkg_hydrofabric(self) -> None:
+        # Read geopackage hydrofabric
+        # hydrofabric <= 2.1 use 'flowpaths' and 'flowpath_attributes'
+        layers = self._read_gpkg_layers({
+            'divides': None,
+            'nexus': None,
+            'flowpaths': ['id', 'toid'],
+            'flowpath_attributes': ['id', 'rl_gages'],
+        }, attribute_layers={'flowpaths', 'flowpath_attributes'})
+        self._set_gpkg_hydrofabric(layers, 'flowpaths', 'flowpath_attributes', 'rl_gages')
 
     def _read_legacy_geojson_hydrofabric(self) -> None:
         # Legacy geojson support
         assert self.catchments is not None, "missing geojson catchments file"
         assert self.nexus is not None, "missing geojson nexus file"
         assert self.crosswalk is not None, "missing crosswalk file"
+        import geopandas as gpd
         self._catchment_hydro_fabric = gpd.read_file(self.catchments)
         self._catchment_hydro_fabric = self._catchment_hydro_fabric.rename(columns=str.lower)
         self._catchment_hydro_fabric.set_index('id', inplace=True)
@@ -272,15 +323,14 @@ class NgenBase(ModelExec):
         self._nexus_hydro_fabric.set_index('id', inplace=True)
 
         self._x_walk = pd.Series(dtype=object)
-        with open(self.crosswalk) as fp:
-            data = json.load(fp)
-            for id, values in data.items():
-                gage = values.get('Gage_no')
-                if gage:
-                    if not isinstance(gage, str):
-                        gage = gage[0]
-                    if gage != "":
-                        self._x_walk[id] = gage
+        data = orjson.loads(Path(self.crosswalk).read_bytes())
+        for id, values in data.items():
+            gage = values.get('Gage_no')
+            if gage:
+                if not isinstance(gage, str):
+                    gage = gage[0]
+                if gage != "":
+                    self._x_walk[id] = gage
 
     @property
     def config_file(self) -> Path:
@@ -431,6 +481,27 @@ class NgenBase(ModelExec):
                 "ngen realization `output_root` field is not supported by ngen.cal. will be removed in future; see https://github.com/NOAA-OWP/ngen-cal/issues/150"
             )
 
+    def _model_param_groups(self, params: pd.DataFrame, id: str | None) -> Mapping[str, np.ndarray]:
+        """Row positions of each model's parameters in `params`.
+
+        Only the iteration value columns of `params` change between calibration
+        iterations, so the grouping is computed once per calibration id and
+        reused for as long as the parameter index is unchanged.
+
+        Args:
+            params (pd.DataFrame): parameter frame with `param` and `model` columns
+            id (str | None): calibration id `params` belong to
+
+        Returns:
+            Mapping[str, np.ndarray]: model name to parameter row positions
+        """
+        cached = self._param_groups.get(id)
+        if cached is not None and cached[0].equals(params.index):
+            return cached[1]
+        groups = params.groupby('model').indices
+        self._param_groups[id] = (params.index, groups)
+        return groups
+
     def update_config(self, i: int, params: pd.DataFrame, id: str = None, path=Path("./")):
         """_summary_
 
@@ -446,32 +517,28 @@ class NgenBase(ModelExec):
             module = self.ngen_realization.catchments[id].formulations[0].params
 
         physical_params = _to_physical_parameter_values(params, i)
-        groups = physical_params.set_index('param').groupby('model')
+        groups = self._model_param_groups(params, id)
+        # pair names and values straight from the column arrays rather than materializing a sub frame per model
+        names = physical_params['param'].to_numpy()
+        values = physical_params[str(i)].to_numpy()
         if isinstance(module, MultiBMI):
             for m in module.modules:
-                name = m.params.model_name
-                if name in groups.groups:
-                    p = groups.get_group(name)
-                    m.params.model_params = p[str(i)].to_dict()
+                p = groups.get(m.params.model_name)
+                if p is not None:
+                    m.params.model_params = dict(zip(names[p], values[p].tolist()))
         else:
-            p = groups.get_group(module.model_name)
-            module.model_params = p[str(i)].to_dict()
+            p = groups[module.model_name]
+            module.model_params = dict(zip(names[p], values[p].tolist()))
         with open(path/self.realization.name, 'w') as fp:
                 fp.write( self.ngen_realization.json(by_alias=True, exclude_none=True, indent=4))
         # Cleanup any t-route parquet files between runs
         # TODO this may not be _the_ best place to do this, but for now,
         # it works, so here it be...
-        import itertools
-        to_remove = (
-            # Path(path).glob("troute_output_*.*"),
-            # Path(path).glob("flowveldepth_*.*"),
-            Path(path).glob("*NEXOUT.parquet"),
-            # ngen files
-            # Path(path).glob("cat-*.csv"),
-            # Path(path).glob("nex-*_output.csv"),
-        )
-        for file in itertools.chain(*to_remove):
-            file.unlink()
+        # filter a single directory listing by suffix rather than globbing into `Path` objects
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.endswith("NEXOUT.parquet"):
+                    os.unlink(entry.path)
 
 class NgenExplicit(NgenBase):
 
@@ -484,33 +551,32 @@ class NgenExplicit(NgenBase):
         start_t = self.ngen_realization.time.start_time
         end_t = self.ngen_realization.time.end_time
         #Setup each calibration catchment
-        for id, catchment in self.ngen_realization.catchments.items():
-
-            if hasattr(catchment, 'calibration'):
-                try:
-                    fabric = self._catchment_hydro_fabric.loc[id]
-                except KeyError:
-                    continue
-                try:
-                    nwis = self._x_walk[id]
-                except KeyError:
-                    raise(RuntimeError(f"Cannot establish mapping of catchment {id} to nwis location in cross walk"))
-                try:
-                    nexus_data = self._nexus_hydro_fabric.loc[fabric['toid']]
-                except KeyError:
-                    raise(RuntimeError(f"No suitable nexus found for catchment {id}"))
+        x_walk = self._x_walk.to_dict()
+        calibrated = {id: catchment for id, catchment in self.ngen_realization.catchments.items() if hasattr(catchment, 'calibration')}
+        # select the hydrofabric rows of every calibrated catchment in one go, catchments
+        # missing from the hydrofabric are skipped. realization order is preserved.
+        common = pd.Index(list(calibrated)).intersection(self._catchment_hydro_fabric.index)
+        for id, fabric in self._catchment_hydro_fabric.loc[common].iterrows():
+            catchment = calibrated[id]
+            nwis = x_walk.get(id)
+            if nwis is None:
+                raise(RuntimeError(f"Cannot establish mapping of catchment {id} to nwis location in cross walk"))
+            try:
+                nexus_data = self._nexus_hydro_fabric.loc[fabric['toid']]
+            except KeyError:
+                raise(RuntimeError(f"No suitable nexus found for catchment {id}"))
 
-                #establish the hydro location for the observation nexus associated with this catchment
-                location = NWISLocation(nwis, nexus_data.name, nexus_data.geometry)
-                nexus = Nexus(nexus_data.name, location, (), Catchment(id, {}))
-                output_var = catchment.formulations[0].params.main_output_variable
-                #read params from the realization calibration definition
-                params = {model:[Parameter(**p) for p in params] for model, params in catchment.calibration.items()}
-                params = _map_params_to_realization(params, catchment)
-                #TODO define these extra params in the realization config and parse them out explicity per catchment, cause why not?
-                eval_params = self.eval_params.copy()
-                eval_params.id = id
-                self._catchments.append(CalibrationCatchment(self.workdir, id, nexus, start_t, end_t, fabric, output_var, eval_params, params))
+            #establish the hydro location for the observation nexus associated with this catchment
+            location = NWISLocation(nwis, nexus_data.name, nexus_data.geometry)
+            nexus = Nexus(nexus_data.name, location, (), Catchment(id, {}))
+            output_var = catchment.formulations[0].params.main_output_variable
+            #read params from the realization calibration definition
+            params = {model:[Parameter(**p) for p in params] for model, params in catchment.calibration.items()}
+            params = _map_params_to_realization(params, catchment)
+            #TODO define these extra params in the realization config and parse them out explicity per catchment, cause why not?
+            eval_params = self.eval_params.copy()
+            eval_params.id = id
+            self._catchments.append(CalibrationCatchment(self.workdir, id, nexus, start_t, end_t, fabric, output_var, eval_params, params))
 
     def update_config(self, i: int, params: pd.DataFrame, id: str, **kwargs):
         """_summary_
@@ -546,10 +612,15 @@ class NgenIndependent(NgenBase):
         catchments = []
         eval_nexus = []
         catchment_realizations = {}
+        # forcing directory -> entry names, listed once rather than once per catchment
+        forcing_entries: dict[Path, list[str]] = {}
         g_conf = self.ngen_realization.global_config.copy(deep=True).dict(by_alias=True)
+        # validate the global configuration as a catchment realization once,
+        # each catchment then gets a deep copy which skips re-validation
+        g_catchment_conf = CatchmentRealization(**g_conf)
         for id in self._catchment_hydro_fabric.index:
             #Copy the global configuration into each catchment
-            catchment_realizations[id] = CatchmentRealization(**g_conf)
+            catchment_realizations[id] = g_catchment_conf.copy(deep=True)
             #Need to fix the forcing definition or ngen will not work
             #for individual catchment configs, it doesn't apply pattern resolution
             #and will read the directory `path` key as the file key and will segfault
@@ -560,47 +631,51 @@ class NgenIndependent(NgenBase):
             if pattern is not None:
                 pattern = pattern.replace("{{id}}", id)
                 pattern = re.compile(pattern.replace("{{ID}}", id))
-                for f in path.iterdir():
-                    if pattern.match(f.name):
-                        catchment_realizations[id].forcing.path = f.resolve()
+                if path not in forcing_entries:
+                    with os.scandir(path) as entries:
+                        forcing_entries[path] = [e.name for e in entries]
+                # NOTE: if several files match, the last one listed wins
+                match = next((name for name in reversed(forcing_entries[path]) if pattern.match(name)), None)
+                if match is not None:
+                    catchment_realizations[id].forcing.path = (path/match).resolve()
 
         self.ngen_realization.catchments = catchment_realizations
 
+        # plain dict lookups avoid raising and catching a KeyError for every ungaged catchment
+        x_walk = self._x_walk.to_dict()
+        # only the catchment `toid` and nexus geometry are needed per catchment,
+        # index those columns once instead of materializing a row Series per catchment
+        catchment_toid = dict(zip(self._catchment_hydro_fabric.index, self._catchment_hydro_fabric['toid'].to_numpy()))
+        nexus_geometry = dict(zip(self._nexus_hydro_fabric.index, self._nexus_hydro_fabric.geometry.to_numpy()))
         for id, catchment in self.ngen_realization.catchments.items():#data['catchments'].items():
-            try:
-                fabric = self._catchment_hydro_fabric.loc[id]
-            except KeyError: # This probaly isn't strictly required since we built these from the index
+            # This probaly isn't strictly required since we built these from the index
+            if id not in catchment_toid:
                 continue
-            try:
-                nexus_data = self._nexus_hydro_fabric.loc[fabric['toid']]
-            except KeyError:
+            nexus_id = catchment_toid[id]
+            if nexus_id not in nexus_geometry:
                 raise(RuntimeError(f"No suitable nexus found for catchment {id}"))
-            nwis = None
-            try:
-                nwis = self._x_walk.loc[id.replace('cat', 'wb')]
-            except KeyError:
-                try:
-                    nwis = self._x_walk.loc[id]
-                except KeyError:
-                    nwis = None
+            nwis = x_walk.get(id.replace('cat', 'wb'))
+            if nwis is None:
+                nwis = x_walk.get(id)
             if nwis is not None:
                 #establish the hydro location for the observation nexus associated with this catchment
-                location = NWISLocation(nwis, nexus_data.name, nexus_data.geometry)
-                nexus = Nexus(nexus_data.name, location, (), Catchment(id, {}))
+                location = NWISLocation(nwis, nexus_id, nexus_geometry[nexus_id])
+                nexus = Nexus(nexus_id, location, (), Catchment(id, {}))
                 eval_nexus.append( nexus ) # FIXME why did I make this a tuple???
             else:
                 #in this case, we don't care if all nexus are observable, just need one downstream
                 #FIXME use the graph to work backwards from an observable nexus to all upstream catchments
                 #and create independent "sets"
-                nexus = Nexus(nexus_data.name, None, (), Catchment(id, {}))
+                nexus = Nexus(nexus_id, None, (), Catchment(id, {}))
             #FIXME pick up params per catchmment somehow???
             params = _map_params_to_realization(self.params, catchment)
             catchments.append(AdjustableCatchment(self.workdir, id, nexus, params))
 
         if self.eval_feature:
+            # nexus id -> first flowpath flowing into it
+            toid_to_wb = self._flowpath_hydro_fabric.reset_index().groupby('toid', sort=False)['id'].first()
             for n in eval_nexus:
-                wb = self._flowpath_hydro_fabric[ self._flowpath_hydro_fabric['toid'] == n.id ]
-                key = wb.iloc[0].name
+                key = toid_to_wb.get(n.id)
                 if key == self.eval_feature:
                     eval_nexus = [n]
                     break
@@ -649,15 +724,23 @@ def _build_gauged_hyfeatures_nexuses(divides: pd.DataFrame, nexuses: pd.DataFram
             type: str
                 USGS gage id
     """
-    eval_nexus: list[Nexus] = []
-    for wb_id, gage_id in crosswalk.items():
+    cat_ids: list[str] = []
+    for wb_id in crosswalk.index:
         assert isinstance(wb_id, str), (
             f"id expected to be str subtype. is type: {type(wb_id)}"
         )
         # NOTE: assume 1 wb to 1 cat AND wb-x is in cat-x
-        nexus_id = divides.loc[wb_id.replace("wb", "cat"), "toid"]
-        contributing_catchments = divides.index[divides["toid"] == nexus_id]
-        nexus_geometry = nexuses.at[nexus_id, "geometry"]
+        cat_ids.append(wb_id.replace("wb", "cat"))
+    # look up each gage's nexus and its geometry in bulk rather than per gage
+    nexus_ids = divides.loc[cat_ids, "toid"].to_numpy()
+    nexus_geometries = nexuses.loc[nexus_ids, "geometry"].to_numpy()
+
+    # nexus id -> contributing divide ids, grouped once rather than masking `divides` per gage
+    contributing = divides.index.to_series().groupby(divides["toid"].to_numpy(), sort=False).agg(list).to_dict()
+
+    eval_nexus: list[Nexus] = []
+    for gage_id, nexus_id, nexus_geometry in zip(crosswalk.to_numpy(), nexus_ids, nexus_geometries):
+        contributing_catchments = contributing.get(nexus_id, [])
         location = NWISLocation(gage_id, nexus_id, nexus_geometry)
         nexus = Nexus(
             nexus_id,
@@ -678,27 +761,27 @@ def _find_eval_feature(eval_feature: str, nexuses: list[Nexus]) -> list[Nexus]:
     their contributions will not be included when comparing against
     observations.
     """
-    candidates: list[Nexus] = []
-
     if eval_feature.startswith("wb-"):
         eval_feature = eval_feature.replace("wb-", "cat-")
 
+    # dispatch on the feature kind once, rather than per nexus
+    if eval_feature.startswith("nex-"):
+        return [n for n in nexuses if eval_feature == n.id]
+
+    if eval_feature.startswith("cat-"):
+        # NOTE: only want to compare at this `wb` / `cat`, NOT all
+        # `cat`s that contribute to entire nexus.
+        # `any` stops at the first match, assume uniqueness
+        return [
+            n for n in nexuses
+            if any(eval_feature == catchment.id for catchment in n.contributing_catchments)
+        ]
+
+    candidates: list[Nexus] = []
     for n in nexuses:
-        if eval_feature.startswith("nex-") and eval_feature == n.id:
+        assert isinstance(n._hydro_location, NWISLocation)
+        if eval_feature == n._hydro_location.station_id:
             candidates.append(n)
-        elif eval_feature.startswith("cat-"):
-            # NOTE: only want to compare at this `wb` / `cat`, NOT all
-            # `cat`s that contribute to entire nexus.
-            for catchment in n.contributing_catchments:
-                if eval_feature == catchment.id:
-                    candidates.append(n)
-                    # assume uniqueness
-                    break
-        else:
-            assert isinstance(n._hydro_location, NWISLocation)
-            if eval_feature == n._hydro_location.station_id:
-                candidates.append(n)
-
     return candidates
 
 class NgenUniform(NgenBase):
@@ -744,6 +827,10 @@ class Ngen(BaseModel, Configurable, smart_union=True):
         return self.__root__
 
     #proxy methods for model
+    #NOTE: these are intentionally not cached. `__root__` is a plain instance attribute
+    #(no `__getattr__` indirection in pydantic v1), cached values would be written into
+    #the model's `__dict__` and leak into `.dict()`/`.json()`, and `best_params` changes
+    #every iteration.
     @property
     def adjustables(self):
         return self.__root__._catchments
@@ -753,15 +840,18 @@ class Ngen(BaseModel, Configurable, smart_union=True):
         return self.__root__.strategy
 
     def restart(self) -> int:
-        starts = []
-        for catchment in self.adjustables:
-            starts.append(catchment.restart())
-        if starts and all( x == starts[0] for x in starts):
-            #if everyone agress on the iteration...
-            return starts[0]
-        else:
-            #starts is empty or someone disagress on the starting iteration...
+        catchments = iter(self.adjustables)
+        first = next(catchments, None)
+        if first is None:
+            #no catchments, nothing to restart
             return 0
+        start = first.restart()
+        for catchment in catchments:
+            if catchment.restart() != start:
+                #someone disagress on the starting iteration...
+                return 0
+        #if everyone agress on the iteration...
+        return start
 
     @property
     def type(self):
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import csv
 import datetime
+import fnmatch
+import functools
+import os
+import re
 import typing
+from multiprocessing.pool import ThreadPool
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 from ngen.cal import hookimpl
 from pydantic import BaseModel
@@ -33,6 +40,10 @@ class TrouteOutput:
         self._validation_options: ValidationOptions | None = None
         self._eval_options: EvaluationOptions | None = None
 
+        # output file -> (file signature, output handler)
+        # parsing an output file is expensive, reuse the handler until the file changes
+        self._handler_cache: dict[Path, tuple[tuple[int, int, int], _NgenCalModelOutputFn]] = {}
+
     @hookimpl
     def ngen_cal_model_configure(self, config: ModelExec) -> None:
         # avoid circular import
@@ -86,6 +97,18 @@ class TrouteOutput:
             )
         return fn
 
+    def _output_handler(self, output_file: Path) -> _NgenCalModelOutputFn:
+        """Memoized `_output_handler_factory`. The handler is rebuilt if `output_file` changes."""
+        stat = output_file.stat()
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        key = output_file.resolve()
+        cached = self._handler_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        fn = self._output_handler_factory(output_file)
+        self._handler_cache[key] = (signature, fn)
+        return fn
+
     # Try external provided output hooks, if those fail, try this one
     # this will only execute if all other hooks return None (or they don't exist)
     @hookimpl(specname="ngen_cal_model_output", trylast=True)
@@ -114,7 +137,7 @@ class TrouteOutput:
             return None
 
         # TODO: I dont think all output handlers can handle validation (csv comes to mind). circle back to this
-        fn = self._output_handler_factory(output_file)
+        fn = self._output_handler(output_file)
         # two scenarios:
         # 1. normal t-route output feature present for each catchment.
         #    Sum all flows for upstream contributing catchments. If this fails,
@@ -124,21 +147,23 @@ class TrouteOutput:
         #   try to get flow using nex- id
         try:
             # 1.
-            nexus_id = int(nexus.contributing_catchments[0].id[len("cat-"):])
-            ds: pd.Series = fn(nexus_id)
-            if ds.empty:
-                raise RuntimeError(f"no data for {nexus_id!s}")
-            for catchment in nexus.contributing_catchments[1:]:
-                nexus_id = int(catchment.id[len("cat-"):])
-                flows = fn(nexus_id)
-                if flows.empty:
+            if not nexus.contributing_catchments:
+                raise RuntimeError(f"no contributing catchments for {nexus.id!s}")
+            flows: list[pd.Series] = []
+            for catchment in nexus.contributing_catchments:
+                nexus_id = _id_number(catchment.id, "cat-")
+                flow = fn(nexus_id)
+                if flow.empty:
                     raise RuntimeError(f"no data for {nexus_id!s}")
-                ds += flows
+                flows.append(flow)
+            # sum all contributing flows in a single aligned reduction.
+            # NOTE: skipna=False so misaligned timesteps are NaN, as with pairwise `+`
+            ds: pd.Series = flows[0] if len(flows) == 1 else pd.concat(flows, axis=1).sum(axis=1, skipna=False)
             print("ngen.cal aggregated contributing routing flows")
         except Exception as e:
             try:
                 # 2.
-                nexus_id = int(nexus.id[len("nex-"):])
+                nexus_id = _id_number(nexus.id, "nex-")
                 ds = fn(nexus_id)
                 if ds.empty:
                     raise RuntimeError(f"no data for {nexus_id!s}")
@@ -157,7 +182,7 @@ class TrouteOutput:
         )
         start = self._ngen_realization.time.start_time
         ds = ds.loc[start + ngen_dt :end]
-        ds = ds.resample("1h").first()
+        ds = _first_per_hour(ds)
         return ds
 
     def _factory_handler_csv(self, filepath: Path) -> _NgenCalModelOutputFn:
@@ -193,47 +218,152 @@ class NgenSaveOutput:
         path = info.workdir
         out_dir = path / f"output_{iteration}"
         Path.mkdir(out_dir)
-        globs = []
-        globs.append(path.glob(self.runoff_pattern))
-        globs.append(path.glob(self.lateral_pattern))
-        globs.append(path.glob(self.terminal_pattern))
-        globs.append(path.glob(self.coastal_pattern))
-        for g in globs:
-            for f in g:
-                f.rename(out_dir / f.name)
+        patterns = (
+            self.runoff_pattern,
+            self.lateral_pattern,
+            self.terminal_pattern,
+            self.coastal_pattern,
+        )
+        # list the workdir once and match all patterns in a single pass
+        matcher = re.compile("|".join(fnmatch.translate(p) for p in patterns))
+        with os.scandir(path) as entries:
+            moves = [
+                (entry.path, out_dir / entry.name)
+                for entry in entries
+                if matcher.match(entry.name)
+            ]
+        # renames are syscall bound and release the GIL; issue them concurrently
+        if moves:
+            with ThreadPool(min(32, len(moves), (os.cpu_count() or 1) * 4)) as pool:
+                pool.starmap(os.rename, moves)
         rpath = path / Path(self.routing_output)
         rpath.rename(out_dir / rpath.name)
 
 
+@functools.lru_cache(maxsize=None)
+def _id_number(id: str, prefix: str) -> int:
+    """Integer part of a prefixed feature id, e.g. `cat-42` -> 42. Cached, ids are looked up every iteration."""
+    return int(id[len(prefix):])
+
+
+def _first_per_hour(ds: pd.Series) -> pd.Series:
+    """
+    Equivalent to `ds.resample("1h").first()`.
+
+    Routing output is typically a regular series that starts on the hour; in
+    that case every `1h / dt`-th value is selected directly instead of binning
+    each timestamp.
+    """
+    index = ds.index
+    hour = pd.Timedelta(hours=1)
+    if isinstance(index, pd.DatetimeIndex) and len(index) > 1:
+        step = index[1] - index[0]
+        if (
+            step > pd.Timedelta(0)
+            and hour % step == pd.Timedelta(0)
+            and index[0] == index[0].floor("h")
+            and (np.diff(index.asi8) == step.value).all()
+            # `first` skips NaNs within a bin
+            and ds.notna().all()
+        ):
+            hourly = ds.iloc[:: hour // step]
+            hourly.index.freq = hour
+            return hourly
+    return ds.resample("1h").first()
+
+
+_CSV_BLOCK_SIZE = 1 << 20
+"""minimum pyarrow csv parse block size in bytes, pyarrow's default"""
+_CSV_ARROW_MAX_COLUMNS = 1024
+"""files with more columns than this are read with `pd.read_csv` rather than pyarrow"""
+
+
+def _read_csv(
+    p: Path,
+    usecols: typing.Optional[typing.Callable[[str], bool]] = None,
+    string_columns: typing.Collection[str] = (),
+) -> pd.DataFrame:
+    """
+    Read csv `p` with pyarrow's multi-threaded csv reader from a memory map.
+
+    Blank header fields are named `Unnamed: {i}` like `pd.read_csv`. Only
+    columns for which `usecols` returns True are read. `string_columns` are
+    left as strings rather than letting pyarrow infer their type.
+
+    pyarrow's per column overhead makes it slower than `pd.read_csv` on wide
+    files (e.g. csv_output v1 has 3 columns per timestep), so those are read
+    with pandas. pyarrow also requires each line to fit in a single parse
+    block; blocks are sized from the header line, and if a row is still too
+    wide, fall back to `pd.read_csv`.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    with p.open("rb") as fp:
+        header_line = fp.readline()
+    header = next(csv.reader([header_line.decode()]))
+    names = [name or f"Unnamed: {i}" for i, name in enumerate(header)]
+    if len(names) > _CSV_ARROW_MAX_COLUMNS:
+        return _pd_read_csv(p, usecols, string_columns)
+    include = [name for name in names if usecols(name)] if usecols is not None else []
+    # rows are typically about as wide as the header; leave headroom for wider
+    # values. pyarrow block sizes are int32
+    block_size = min(max(_CSV_BLOCK_SIZE, 4 * len(header_line)), 2**31 - 1)
+    try:
+        # parse straight from the page cache rather than copying the file into
+        # user space buffers first
+        with pa.memory_map(str(p), "r") as source:
+            table = pa_csv.read_csv(
+                source,
+                read_options=pa_csv.ReadOptions(
+                    column_names=names, skip_rows=1, block_size=block_size
+                ),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=include,
+                    column_types={name: pa.string() for name in string_columns},
+                ),
+            )
+    except pa.ArrowInvalid:
+        return _pd_read_csv(p, usecols, string_columns)
+    return table.to_pandas()
+
+
+def _pd_read_csv(
+    p: Path,
+    usecols: typing.Optional[typing.Callable[[str], bool]],
+    string_columns: typing.Collection[str],
+) -> pd.DataFrame:
+    """`pd.read_csv` with `_read_csv`'s arguments."""
+    # NOTE: pandas takes a much slower per column path for any `dtype` mapping, even an empty one
+    dtype = {name: str for name in string_columns} or None
+    return pd.read_csv(p, usecols=usecols, dtype=dtype)
+
+
+_CSV_OUTPUT_V1_COLUMN = re.compile(rb"\((\d+), '([^']+)'\)")
+"""csv_output v1 column pattern, captures the simulation hour and variable name of e.g. `(0, 'q')`"""
+
+
 def _read_csv_output_v1_no_time(filepath: Path) -> pd.DataFrame:
     # header: ","(0, 'q')","(0, 'v')","(0, 'd')",..."
     # row   : "2420800,0.0,0.0,0.0,..."
     # n_columns = 1 + number of timesteps (`nts`) * 3
-    df = pd.read_csv(filepath, index_col=0)
-    df.index = df.index.map(lambda x: "wb-" + str(x))
-    df.index.name = "waterbody_code"
-    tuples = [_parse_column_csv_output_v1(x) for x in df.columns]
-    df.columns = pd.MultiIndex.from_tuples(
-        tuples, names=("simulation_hour", "variable_name")
+    # only streamflow, `q`, is used. skip reading `v` and `d` columns entirely.
+    # parse every column label in one pass over the raw header
+    with filepath.open("rb") as fp:
+        header = fp.readline()
+    labels = _CSV_OUTPUT_V1_COLUMN.findall(header)
+    hours = np.fromiter(
+        (int(hour) for hour, variable in labels if variable == b"q"), dtype=np.int64
     )
-    return df
-
-
-def _parse_column_csv_output_v1(s: str) -> tuple[int, str]:
-    # example column: (0, 'q')
-    assert s.startswith("(") and s.endswith("')")
-    int_end = 0
-    char_start = 0
-    for i, c in enumerate(s[:-2]):
-        if c == ",":
-            assert int_end == 0
-            int_end = i
-        elif c == "'":
-            char_start = i
-            break
 
-    assert char_start > int_end
-    return int(s[1:int_end]), s[char_start + 1 : -2]
+    df = _read_csv(filepath, usecols=lambda col: col == "Unnamed: 0" or col.endswith("'q')"))
+    df.set_index("Unnamed: 0", inplace=True)
+    if len(hours) != len(df.columns):
+        raise ValueError(f"malformed csv_output v1 header: {filepath!s}")
+    df.index = "wb-" + df.index.astype(str)
+    df.index.name = "waterbody_code"
+    df.columns = pd.Index(hours, name="simulation_hour")
+    return df
 
 
 def _routing_timestep_size_s(routing_n_ts: int, realization: NgenRealization) -> int:
@@ -247,15 +377,15 @@ def _routing_timestep_size_s(routing_n_ts: int, realization: NgenRealization) ->
     r_n_ts_in_ngen_ts = routing_n_ts / ngen_n_ts
 
     r_dt, r = divmod(ngen_ts_s, r_n_ts_in_ngen_ts)
-    assert r == 0, "routing timestep is not evenly divisible by ngen_timesteps"
+    if r != 0:
+        raise ValueError("routing timestep is not evenly divisible by ngen_timesteps")
     return int(r_dt)
 
 
 def _csv_output_v1(p: Path, realization: NgenRealization) -> _NgenCalModelOutputFn:
     df = _read_csv_output_v1_no_time(p)
 
-    columns = typing.cast(pd.MultiIndex, df.columns)
-    routing_n_ts = columns.levshape[0]
+    routing_n_ts = len(df.columns)
     routing_ts_s = _routing_timestep_size_s(routing_n_ts, realization)
 
     r_dt = datetime.timedelta(seconds=routing_ts_s)
@@ -265,53 +395,104 @@ def _csv_output_v1(p: Path, realization: NgenRealization) -> _NgenCalModelOutput
 
     r_dt_range = pd.date_range(start, end, freq=r_dt, inclusive="right")
 
-    def get_output(id: str) -> pd.Series:
-        ds = df.loc[id, (slice(None), "q")]
-        ds.index = r_dt_range
-        return ds
+    # resolve rows once; each lookup is a row of the streamflow array
+    values = df.to_numpy()
+    rows = {wb: i for i, wb in enumerate(df.index)}
+
+    def get_output(id: int) -> pd.Series:
+        wb = f"wb-{id}"
+        i = rows.get(wb)
+        if i is None:
+            return pd.Series(np.empty(0, dtype=values.dtype), index=r_dt_range[:0], name=wb)
+        return pd.Series(values[i], index=r_dt_range, name=wb)
 
     return get_output
 
 
+def _output_by_waterbody(df: pd.DataFrame, by: str = "waterbody_code") -> _NgenCalModelOutputFn:
+    """
+    Sort `df`'s `value` column by waterbody once so each waterbody's rows are
+    contiguous and a lookup is a binary search and slice rather than a mask
+    over the whole frame. Row order within a waterbody is kept.
+    Unknown waterbodies return an empty series.
+    """
+    order = np.argsort(df[by].to_numpy(), kind="stable")
+    codes = df[by].to_numpy()[order]
+    values: pd.Series = df["value"].iloc[order]
+
+    def get_output(id: int) -> pd.Series:
+        lo = codes.searchsorted(id, side="left")
+        hi = codes.searchsorted(id, side="right")
+        return values.iloc[lo:hi]
+
+    return get_output
+
+
+_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+"""datetime format t-route writes to stream csv output, e.g. `2010-10-01 00:00:00`"""
+
+
+def _to_datetime(values: pd.Series) -> pd.Series:
+    """
+    `pd.to_datetime` using t-route's datetime format rather than inferring it
+    per value. Falls back to inference if `values` are formatted differently.
+    """
+    try:
+        return pd.to_datetime(values, format=_DATETIME_FORMAT, cache=True)
+    except ValueError:
+        return pd.to_datetime(values, cache=True)
+
+
+def _to_timedelta(values: pd.Series) -> pd.Series:
+    """
+    `pd.to_timedelta` that parses each distinct value once. Stream output
+    repeats the same few forecast offsets for every waterbody.
+    """
+    codes, uniques = pd.factorize(values)
+    if (codes == -1).any():
+        # missing values, let pandas handle them
+        return pd.to_timedelta(values)
+    parsed = pd.to_timedelta(uniques).take(codes)
+    return pd.Series(parsed, index=values.index, name=values.name)
+
+
 # change from v1-v2 introduced in https://github.com/NOAA-OWP/t-route/pull/818
 def _stream_output_csv_v1(p: Path) -> _NgenCalModelOutputFn:
     # header: ",,t0,time,flow,velocity,depth,nudge"
     # row   : "6680,wb,2010-10-01 00:00:00,1:00:00,0.0,0.0,0.0,-9999.0"
-    df = pd.read_csv(p)
+    columns = ("Unnamed: 0", "t0", "time", "flow")
+    df = _read_csv(p, usecols=columns.__contains__, string_columns=("t0", "time"))
     # 't0' is reference time
-    df["t0"] = pd.to_datetime(df["t0"])
+    df["t0"] = _to_datetime(df["t0"])
     # 'time' is the forecast hour
-    df["time"] = pd.to_timedelta(df["time"])
+    df["time"] = _to_timedelta(df["time"])
     df["value_time"] = df["t0"] + df["time"]
-    df.rename(columns={"flow": "value", df.columns[0]: "waterbody_code"}, inplace=True)
+    df.rename(columns={"flow": "value", "Unnamed: 0": "waterbody_code"}, inplace=True)
+    df["waterbody_code"] = df["waterbody_code"].astype("int32")
     df.set_index("value_time", inplace=True)
 
-    def get_output(id: int) -> pd.Series:
-        return df.loc[df["waterbody_code"] == id, "value"]
-
-    return get_output
+    return _output_by_waterbody(df)
 
 
 # change from v1-v2 introduced in https://github.com/NOAA-OWP/t-route/pull/818
 def _stream_output_csv_v2(p: Path) -> _NgenCalModelOutputFn:
     # header: ",,current_time,flow,velocity,depth,nudge"
     # row   : "6680,wb,2010-10-01 1:00:00,0.0,0.0,0.0,-9999.0"
-    df = pd.read_csv(p)
-    df["value_time"] = pd.to_datetime(df["current_time"])
-    df.rename(columns={"flow": "value", df.columns[0]: "waterbody_code"}, inplace=True)
+    columns = ("Unnamed: 0", "current_time", "flow")
+    df = _read_csv(p, usecols=columns.__contains__, string_columns=("current_time",))
+    df["value_time"] = _to_datetime(df["current_time"])
+    df.rename(columns={"flow": "value", "Unnamed: 0": "waterbody_code"}, inplace=True)
+    df["waterbody_code"] = df["waterbody_code"].astype("int32")
     df.set_index("value_time", inplace=True)
 
-    def get_output(id: int) -> pd.Series:
-        return df.loc[df["waterbody_code"] == id, "value"]
-
-    return get_output
+    return _output_by_waterbody(df)
 
 
 # TODO: doc when change was made
 # TODO: revist
 def _model_output_legacy_hdf5(p: Path) -> pd.DataFrame:
     df = pd.read_hdf(p)
-    df.index = df.index.map(lambda x: "wb-" + str(x))
+    df.index = "wb-" + df.index.astype(str)
     df.columns = pd.MultiIndex.from_tuples(df.columns)
     return df
 
@@ -325,24 +506,32 @@ def _stream_output_netcdf_v1(p: Path) -> _NgenCalModelOutputFn:
             "`ngen.cal` not installed with `netcdf` support. Re-install with feature flag `[netcdf]`"
         ) from e
 
-    ds = xr.open_dataset(p)
-    flow = ds.get("flow")
-    assert flow is not None
+    # pull the (feature_id, time) flow array straight out of the dataset rather
+    # than reshaping it into a long frame with `to_dataframe`
+    with xr.open_dataset(p) as ds:
+        flow = ds.get("flow")
+        if flow is None:
+            raise ValueError(f"no `flow` variable in t-route netcdf output file: {p!s}")
+        if "feature_id" not in flow.coords or "time" not in flow.dims:
+            raise ValueError(f"expected `flow` over `feature_id` and `time`: {p!s}")
+
+        if "feature_id" in flow.dims:
+            flow = flow.transpose("feature_id", "time")
+        else:
+            # single feature output, `feature_id` is a scalar coordinate
+            flow = flow.expand_dims("feature_id")
 
-    df: pd.DataFrame = flow.to_dataframe()
-    df.reset_index(inplace=True)
+        values = flow.to_numpy()
+        feature_ids = flow["feature_id"].to_numpy()
+        value_time = pd.DatetimeIndex(flow["time"].to_numpy(), name="value_time")
 
-    expected_columns = ["feature_id", "time", "flow"]
-    assert df.columns.isin(expected_columns).sum() == len(expected_columns)
-
-    df.rename(
-        columns={"flow": "value", "time": "value_time", "feature_id": "waterbody_code"},
-        inplace=True,
-    )
-    df.set_index("value_time", inplace=True)
+    positions = {fid: i for i, fid in enumerate(feature_ids.tolist())}
 
     def get_output(id: int) -> pd.Series:
-        return df.loc[df["waterbody_code"] == id, "value"]
+        i = positions.get(id)
+        if i is None:
+            return pd.Series(np.empty(0, dtype=values.dtype), index=value_time[:0], name="value")
+        return pd.Series(values[i], index=value_time, name="value")
 
     return get_output
 
@@ -352,12 +541,17 @@ def _stream_output_parquet_v1(p: Path) -> _NgenCalModelOutputFn:
     # 0  wb-2420800  0.0   2023-04-02 00:05:00  streamflow    m3/s  2023-04-02     None
     # 1  wb-2420800  0.0   2023-04-02 00:05:00  velocity      m/s   2023-04-02     None
     # 2  wb-2420800  0.0   2023-04-02 00:05:00  depth         m     2023-04-02     None
-    df = pd.read_parquet(p)
+    # only read streamflow rows and the columns used; lets pyarrow skip row
+    # groups and column chunks entirely
+    df = pd.read_parquet(
+        p,
+        columns=["location_id", "value", "value_time"],
+        filters=[("variable_name", "==", "streamflow")],
+    )
     df.set_index("value_time", inplace=True)
+    by_location = _output_by_waterbody(df, by="location_id")
 
     def get_output(id: int) -> pd.Series:
-        return df.loc[
-            (df["location_id"] == f"wb-{id}") & (df["variable_name"] == "streamflow"), "value"
-        ]
+        return by_location(f"wb-{id}")
 
     return get_output
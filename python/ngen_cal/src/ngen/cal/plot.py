@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import geopandas as gpd
 import pandas as pd
 import json
 import matplotlib.pyplot as plt
@@ -25,6 +24,8 @@ def plot_objective(objective_log_file: Path):
 
 def plot_stuff(workdir, catchment_data, nexus_data, cross_walk, config_file):
 
+    import geopandas as gpd
+
     catchments = []
     #Read the catchment hydrofabric data
     catchment_hydro_fabric = gpd.read_file(catchment_data)
@@ -75,6 +76,8 @@ def plot_stuff(workdir, catchment_data, nexus_data, cross_walk, config_file):
         catchment.output.plot(ax=ax2, label='simulated')
 
 def plot_obs(id, catchment_data, nexus_data, cross_walk):
+    import geopandas as gpd
+
     #Read the catchment hydrofabric data
     catchment_hydro_fabric = gpd.read_file(catchment_data)
     catchment_hydro_fabric.set_index('ID', inplace=True)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from contextlib import contextmanager
 from os import getcwd, chdir
 from typing import Callable, TYPE_CHECKING
@@ -28,6 +29,22 @@ def pushd(path: Path) -> None:
         #when finished, return to original working dir
         chdir(cwd)
 
+@contextmanager
+def disable_logging(level: int = logging.DEBUG) -> None:
+    """Disable logging calls of severity `level` and below for duration of the context
+
+    Args:
+        level (int): logging level to disable. Defaults to logging.DEBUG
+    """
+    #save the current disable level
+    previous = logging.root.manager.disable
+    logging.disable(level)
+    try:
+        yield #yield context
+    finally:
+        #when finished, restore the original disable level
+        logging.disable(previous)
+
 def import_from_string(path: str) -> Any:
     """Import an object or module from a string."""
     from importlib import import_module
@@ -3,9 +3,14 @@ from __future__ import annotations
 import pathlib
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
 import pytest
+from hypy.catchment import Catchment
+from hypy.nexus import Nexus
 from ngen.cal.ngen import NgenBase
-from ngen.cal.ngen_hooks.ngen_output import TrouteOutput
+from ngen.cal.ngen_hooks import ngen_output
+from ngen.cal.ngen_hooks.ngen_output import TrouteOutput, _first_per_hour
 from ngen.config.realization import NgenRealization
 
 data_dir = pathlib.Path(__file__).parent / "data/troute_output/"
@@ -38,8 +43,9 @@ def test_ngen_cal_model_output(file: pathlib.Path, ngen_cal_model_config: NgenBa
     # setup plugin
     output.ngen_cal_model_configure(config=ngen_cal_model_config)
 
-    feature = "wb-2420800"
-    df = output.get_output(id=feature)
+    catchment = Catchment("cat-2420800", {})
+    nexus = Nexus("nex-2420800", None, contributing_catchments=(catchment,))
+    df = output.get_output(nexus)
     assert df is not None, "expect to receive pd.Series"
 
     dt = datetime.fromisoformat("2023-04-02 01:00:00")
@@ -47,3 +53,150 @@ def test_ngen_cal_model_output(file: pathlib.Path, ngen_cal_model_config: NgenBa
 
     # testing data is for a single day
     assert len(df) == 24
+
+
+# NOTE: expected outputs below are computed the way the output handlers
+# originally did, with plain pandas, to check the handlers' results against.
+def _expected_csv_output_v1(p: pathlib.Path, realization: NgenRealization, id: int) -> pd.Series:
+    df = pd.read_csv(p, index_col=0)
+    ds = df.loc[id, [c for c in df.columns if c.endswith("'q')")]]
+    start, end = realization.time.start_time, realization.time.end_time
+    ds.index = pd.date_range(start, end, periods=len(ds) + 1, inclusive="right")
+    return ds
+
+
+def _expected_stream_output_csv_v1(p: pathlib.Path, realization: NgenRealization, id: int) -> pd.Series:
+    df = pd.read_csv(p)
+    df["value_time"] = pd.to_datetime(df["t0"]) + pd.to_timedelta(df["time"])
+    df = df.set_index("value_time")
+    return df.loc[df[df.columns[0]] == id, "flow"].rename("value")
+
+
+def _expected_stream_output_csv_v2(p: pathlib.Path, realization: NgenRealization, id: int) -> pd.Series:
+    df = pd.read_csv(p)
+    df["value_time"] = pd.to_datetime(df["current_time"])
+    df = df.set_index("value_time")
+    return df.loc[df[df.columns[0]] == id, "flow"].rename("value")
+
+
+def _expected_stream_output_netcdf_v1(p: pathlib.Path, realization: NgenRealization, id: int) -> pd.Series:
+    import xarray as xr
+
+    with xr.open_dataset(p) as ds:
+        df = ds["flow"].to_dataframe().reset_index()
+    df = df.rename(columns={"time": "value_time", "flow": "value"}).set_index("value_time")
+    return df.loc[df["feature_id"] == id, "value"]
+
+
+def _expected_stream_output_parquet_v1(p: pathlib.Path, realization: NgenRealization, id: int) -> pd.Series:
+    df = pd.read_parquet(p).set_index("value_time")
+    return df.loc[(df["location_id"] == f"wb-{id}") & (df["variable_name"] == "streamflow"), "value"]
+
+
+def _write_stream_output_csv_v1(p: pathlib.Path, ids: list[int]):
+    # header: ",,t0,time,flow,velocity,depth,nudge"
+    t0 = "2023-04-02 00:00:00"
+    lines = [",,t0,time,flow,velocity,depth,nudge"]
+    rng = np.random.default_rng(0)
+    # interleave waterbodies, handlers must group rows by waterbody
+    for hour in range(1, 25):
+        for id in ids:
+            lines.append(f"{id},wb,{t0},{hour}:00:00,{rng.random()},0.0,0.0,-9999.0")
+    p.write_text("\n".join(lines) + "\n")
+
+
+@pytest.fixture
+def realization() -> NgenRealization:
+    return NgenRealization.parse_file(data_dir / "example_realization_config.json")
+
+
+@pytest.mark.parametrize(
+    "file,factory,expected_fn",
+    (
+        (data_dir / "flowveldepth.csv", "_csv_output_v1", _expected_csv_output_v1),
+        (data_dir / "troute_output.csv", "_stream_output_csv_v2", _expected_stream_output_csv_v2),
+        (data_dir / "troute_output.nc", "_stream_output_netcdf_v1", _expected_stream_output_netcdf_v1),
+        (data_dir / "flowveldepth.parquet", "_stream_output_parquet_v1", _expected_stream_output_parquet_v1),
+    ),
+)
+def test_output_handler(file: pathlib.Path, factory: str, expected_fn, realization: NgenRealization):
+    if factory == "_csv_output_v1":
+        fn = ngen_output._csv_output_v1(file, realization)
+    else:
+        fn = getattr(ngen_output, factory)(file)
+
+    id = 2420800
+    expected = expected_fn(file, realization, id)
+    assert not expected.empty
+    pd.testing.assert_series_equal(fn(id), expected, check_names=False, check_freq=False)
+
+    # unknown waterbodies have no output
+    assert fn(42).empty
+
+
+def test_stream_output_csv_v1(tmp_path: pathlib.Path, realization: NgenRealization):
+    p = tmp_path / "troute_output.csv"
+    ids = [2420802, 2420800, 2420801]
+    _write_stream_output_csv_v1(p, ids)
+
+    fn = ngen_output._stream_output_csv_v1(p)
+    for id in ids:
+        expected = _expected_stream_output_csv_v1(p, realization, id)
+        assert len(expected) == 24
+        pd.testing.assert_series_equal(fn(id), expected, check_names=False)
+    assert fn(42).empty
+
+
+def test_output_handler_cache(tmp_path: pathlib.Path, ngen_cal_model_config: NgenBase):
+    p = tmp_path / "troute_output.csv"
+    _write_stream_output_csv_v1(p, [2420800])
+
+    output = TrouteOutput(p)
+    output.ngen_cal_model_configure(config=ngen_cal_model_config)
+
+    fn = output._output_handler(p)
+    # unchanged file, reuse the handler
+    assert output._output_handler(p) is fn
+
+    # rewritten file, rebuild the handler
+    _write_stream_output_csv_v1(p, [2420800, 2420801])
+    new_fn = output._output_handler(p)
+    assert new_fn is not fn
+    assert fn(2420801).empty
+    assert not new_fn(2420801).empty
+
+
+@pytest.mark.parametrize(
+    "index",
+    (
+        pd.date_range("2023-04-02 01:00:00", periods=48, freq="5min"),
+        pd.date_range("2023-04-02 01:00:00", periods=48, freq="1h"),
+        # not aligned to the hour
+        pd.date_range("2023-04-02 01:10:00", periods=48, freq="5min"),
+    ),
+)
+def test_first_per_hour(index: pd.DatetimeIndex):
+    ds = pd.Series(range(len(index)), index=index, dtype=float)
+    pd.testing.assert_series_equal(_first_per_hour(ds), ds.resample("1h").first())
+
+
+# read wide files with both pandas and pyarrow
+@pytest.mark.parametrize("arrow_max_columns", (ngen_output._CSV_ARROW_MAX_COLUMNS, 1 << 20))
+def test_csv_output_v1_header_wider_than_block(
+    arrow_max_columns: int, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(ngen_output, "_CSV_ARROW_MAX_COLUMNS", arrow_max_columns)
+    # ~100 days of 5 minute routing output; header is larger than 1MB
+    nts = 30_000
+    columns = [f"({t}, '{var}')" for t in range(nts) for var in "qvd"]
+    values = np.arange(2 * len(columns), dtype=float).reshape(2, -1) / 10
+    p = tmp_path / "flowveldepth.csv"
+    pd.DataFrame(values, index=[2420800, 2420801], columns=columns).to_csv(p)
+    assert len(p.open("rb").readline()) > ngen_output._CSV_BLOCK_SIZE
+
+    df = ngen_output._read_csv_output_v1_no_time(p)
+
+    expected = pd.read_csv(p, index_col=0).iloc[:, ::3]
+    assert list(df.index) == ["wb-2420800", "wb-2420801"]
+    assert list(df.columns) == list(range(nts))
+    np.testing.assert_array_equal(df.to_numpy(), expected.to_numpy())
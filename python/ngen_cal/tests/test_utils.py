@@ -1,6 +1,6 @@
 from types import ModuleType, FunctionType
 
-from ngen.cal.utils import PyObjectOrModule, type_as_import_string
+from ngen.cal.utils import PyObjectOrModule, disable_logging, type_as_import_string
 from pydantic import BaseModel
 
 
@@ -49,3 +49,13 @@ def test_serialize():
 
 def test_schema():
     assert Foo.schema()["properties"]["mod"]["type"] == "string"
+
+
+def test_disable_logging_restores_previous_level():
+    import logging
+
+    previous = logging.root.manager.disable
+    with disable_logging():
+        assert logging.root.manager.disable == logging.DEBUG
+        assert not logging.getLogger(__name__).isEnabledFor(logging.DEBUG)
+    assert logging.root.manager.disable == previous
@@ -10,7 +10,6 @@ from ngen.config.model_vars import (
     resolve_inputs_mapping,
     resolve_outputs_mapping,
 )
-from dataclasses import dataclass
 from enum import Enum, auto
 from collections.abc import Iterable
 import typing
@@ -43,7 +42,7 @@ def main() -> None:
 def aorc_forcing() -> Model:
     output_builder = OutputsBuilder()
     # TODO: add unit support
-    for name, (aliases, unit) in _aorc_forcing.items():
+    for name, aliases, unit in _aorc_forcing:
         var = Var(name=name)
         output_builder.add_output(var, *aliases)
     outputs = output_builder.build()
@@ -52,43 +51,24 @@ def aorc_forcing() -> Model:
 
 
 def sloth() -> ModelTemplate:
-    _sloth_vars: list[ModelVarDict] = [
-        {
-            "name": "sloth_ice_fraction_schaake",
-            "unit": "m",
-            "dtype": "double",
-            "type": "output",
-        },
-        {
-            "name": "sloth_ice_fraction_xinanjiang",
-            "unit": "-",
-            "dtype": "double",
-            "type": "output",
-        },
-        {
-            "name": "sloth_smp",
-            "unit": "-",
-            "dtype": "double",
-            "type": "output",
-        },
-    ]
-    vars = create_model_vars(_sloth_vars)
-    return into_model_template("sloth", vars)
+    _sloth_vars: tuple[ModelVarT, ...] = (
+        ModelVarT("sloth_ice_fraction_schaake", "m", "double", "output"),
+        ModelVarT("sloth_ice_fraction_xinanjiang", "-", "double", "output"),
+        ModelVarT("sloth_smp", "-", "double", "output"),
+    )
+    return _build_template("sloth", _sloth_vars)
 
 
 def cfe() -> ModelTemplate:
-    vars = create_model_vars(_cfe_vars)
-    return into_model_template("cfe", vars)
+    return _build_template("cfe", _cfe_vars)
 
 
 def nom() -> ModelTemplate:
-    vars = create_model_vars(_nom_vars)
-    return into_model_template("nom", vars)
+    return _build_template("nom", _nom_vars)
 
 
 def topmodel() -> ModelTemplate:
-    vars = create_model_vars(_topmodel_vars)
-    return into_model_template("topmodel", vars)
+    return _build_template("topmodel", _topmodel_vars)
 
 
 # TODO: optionally, pull these from a realization config
@@ -123,18 +103,9 @@ class IODirection(Enum):
     output = auto()
 
 
-@dataclass
-class BmiVar:
-    name: str
-    unit: str
-    dtype: str
-    direction: IODirection
-
-    def as_var(self) -> Var:
-        return Var(name=self.name)
-
-
 class Model(ModelMeta):
+    __slots__ = ("_name", "_inputs", "_outputs")
+
     def __init__(self, name: str, inputs: Inputs, outputs: Outputs):
         self._name: str = name
         self._inputs: Inputs = inputs
@@ -154,6 +125,8 @@ class Model(ModelMeta):
 
 
 class ModelTemplate:
+    __slots__ = ("_name", "_inputs_builder", "_outputs_builder")
+
     def __init__(
         self, name: str, inputs_builder: InputsBuilder, outputs_builder: OutputsBuilder
     ):
@@ -165,9 +138,10 @@ class ModelTemplate:
         return self._name
 
     def add_alias(self, name: str, alias: str) -> Self:
-        try:
+        # test membership rather than catching `add_alias`'s `KeyError`
+        if name in self._inputs_builder._inputs._inputs:
             self._inputs_builder.add_alias(name, alias)
-        except KeyError:
+        else:
             self._outputs_builder.add_alias(name, alias)
         return self
 
@@ -182,57 +156,53 @@ class ModelTemplate:
         return f"ModelTemplate(name={self._name}, inputs={str(self._inputs_builder)}, outputs={str(self._outputs_builder)})"
 
 
-def add_alias(model: ModelTemplate, name: str, alias: str) -> None:
-    """add alias to existing ModelTemplate"""
+def add_aliases(model: ModelTemplate, mapping: dict[str, str]) -> None:
+    """
+    add aliases to existing ModelTemplate. mapping keys or values can be the
+    existing variable name.
+    """
+    # resolve the name tables once. these are the live tables, so aliases
+    # added earlier in the loop are visible to later entries.
     inputs = model._inputs_builder._inputs._inputs
     outputs = model._outputs_builder._outputs._outputs
-    if name in inputs or name in outputs:
-        model.add_alias(name, alias)
-    elif alias in inputs or alias in outputs:
-        model.add_alias(alias, name)
-    else:
-        assert "unreachable"
-
-
-def add_aliases(model: ModelTemplate, mapping: dict[str, str]) -> None:
-    """add aliases to existing ModelTemplate"""
     for name, alias in mapping.items():
-        add_alias(model, name, alias)
+        if name in inputs or name in outputs:
+            model.add_alias(name, alias)
+        elif alias in inputs or alias in outputs:
+            model.add_alias(alias, name)
+        else:
+            raise KeyError(f"{model.name()!r} has no variable {name!r} or {alias!r}")
 
 
-class ModelVarDict(typing.TypedDict):
+class ModelVarT(typing.NamedTuple):
     name: str
     unit: str
     dtype: str
     type: typing.Literal["input", "output"]
 
 
-def create_model_vars(vars: list[ModelVarDict]) -> Iterable[BmiVar]:
-    # {"name": "SFCPRS", "unit": "Pa", "dtype": "double", "type": "input"},
-    for var in vars:
-        ty = var["type"]
-        if ty == "input":
-            direction = IODirection.input
-        elif ty == "output":
-            direction = IODirection.output
-        else:
-            assert False, "unreachable"
-        name = var["name"]
-        unit = var["unit"]
-        dtype = var["dtype"]
-        yield BmiVar(name=name, unit=unit, dtype=dtype, direction=direction)
+_io_directions: dict[str, IODirection] = {
+    "input": IODirection.input,
+    "output": IODirection.output,
+}
 
 
-def into_model_template(model_name: str, vars: Iterable[BmiVar]) -> ModelTemplate:
+def _io_direction(ty: str) -> IODirection:
+    try:
+        return _io_directions[ty]
+    except KeyError:
+        raise ValueError(f"unknown variable type: {ty!r}") from None
+
+
+def _build_template(model_name: str, vars: Iterable[ModelVarT]) -> ModelTemplate:
+    """build a `ModelTemplate` from a model's variable table"""
     inputs_builder = InputsBuilder()
     outputs_builder = OutputsBuilder()
     for var in vars:
-        if var.direction == IODirection.input:
-            inputs_builder.add_input(var.as_var())
-        elif var.direction == IODirection.output:
-            outputs_builder.add_output(var.as_var())
+        if _io_direction(var.type) is IODirection.input:
+            inputs_builder.add_input(Var(name=var.name))
         else:
-            assert "unreachable"
+            outputs_builder.add_output(Var(name=var.name))
     return ModelTemplate(
         name=model_name, inputs_builder=inputs_builder, outputs_builder=outputs_builder
     )
@@ -241,56 +211,80 @@ def into_model_template(model_name: str, vars: Iterable[BmiVar]) -> ModelTemplat
 # mermaid chart generation code
 
 
+_mermaid_escape_translations = str.maketrans(
+    {
+        "~": "\\~",
+    }
+)
+
+
 def _mermaid_str(s: str) -> str:
-    _mermaid_escape_translations = str.maketrans(
-        {
-            "~": "\\~",
-        }
-    )
+    # most names have nothing to escape
+    if "~" not in s:
+        return s
     return s.translate(_mermaid_escape_translations)
 
 
-def into_mermaid_flowchart(model_stack: Iterable[Model]) -> str:
+def into_mermaid_flowchart(
+    model_stack: Iterable[Model], mapped_outputs_only: bool = False
+) -> str:
+    """
+    If `mapped_outputs_only`, only include outputs that are mapped to another
+    model's input. All of the last model's outputs are always included.
+    """
+    model_stack = tuple(model_stack)
+    last_name = model_stack[-1].name() if model_stack else None
+    # node id prefix for each model's variables
+    prefix = {model.name(): f"{model.name()}_" for model in model_stack}
     valid_mapping, _ = resolve_inputs_mapping(*model_stack)
 
-    mapped_output = set()
-    for model, vars in valid_mapping.items():
-        for var in vars:
-            name = _mermaid_str(f"{var.src.model}_{var.src.var.name}")
-            mapped_output.add(name)
+    mapped_output: set[str] = set()
+    if mapped_outputs_only:
+        mapped_output = {
+            prefix[var.src.model] + var.src.var.name
+            for vars in valid_mapping.values()
+            for var in vars
+        }
 
     chart = ["flowchart LR"]
+    append = chart.append
     for model in model_stack:
         model_name = model.name()
+        model_prefix = prefix[model_name]
+        inputs = model.inputs().inputs()
+        outputs = model.outputs().outputs()
         subgraph_start = _mermaid_str(f"\tsubgraph {model_name}")
-        chart.append(subgraph_start)
-        for var in model.inputs().inputs():
+        append(subgraph_start)
+        for var in inputs:
             subgraph_input_var = _mermaid_str(
-                f'\t{model_name}_{var.name}["{var.name}"]'
+                f'\t{model_prefix}{var.name}["{var.name}"]'
             )
-            chart.append(subgraph_input_var)
-        for var in model.outputs().outputs():
-            name = f"{model_name}_{var.name}"
+            append(subgraph_input_var)
+        for var in outputs:
+            name = model_prefix + var.name
             # TODO: I think if I pull out subgraph creation that might help things?
             #       it just needs to be more composable
-            # if name not in mapped_output and model_name != model_stack[-1].name():
-            #    continue
+            if (
+                mapped_outputs_only
+                and name not in mapped_output
+                and model_name != last_name
+            ):
+                continue
             subgraph_output_var = _mermaid_str(f'\t{name}>"{var.name}"]')
-            chart.append(subgraph_output_var)
-        subgraph_end = _mermaid_str("\tend")
-        chart.append(subgraph_end)
+            append(subgraph_output_var)
+        append("\tend")
 
     for vars in valid_mapping.values():
         for var in vars:
             if var.is_src_alias() or var.is_dest_alias():
                 connection = _mermaid_str(
-                    f'\t{var.src.model}_{var.src.var.name} -- "{var.via}" --> {var.dest.model}_{var.dest.var.name}'
+                    f'\t{prefix[var.src.model]}{var.src.var.name} -- "{var.via}" --> {prefix[var.dest.model]}{var.dest.var.name}'
                 )
             else:
                 connection = _mermaid_str(
-                    f"\t{var.src.model}_{var.src.var.name} --> {var.dest.model}_{var.dest.var.name}"
+                    f"\t{prefix[var.src.model]}{var.src.var.name} --> {prefix[var.dest.model]}{var.dest.var.name}"
                 )
-            chart.append(connection)
+            append(connection)
 
     return "\n".join(chart)
 
@@ -325,194 +319,134 @@ AORC_FIELD_NAME_WIND_U_10M_AG = "UGRD_10maboveground"
 AORC_FIELD_NAME_WIND_V_10M_AG = "VGRD_10maboveground"
 AORC_FIELD_NAME_SPEC_HUMID_2M_AG = "SPFH_2maboveground"
 
-# name: (aliases, unit)
-_aorc_forcing = {
-    "precip_rate": (("RAINRATE", CSDMS_STD_NAME_LIQUID_EQ_PRECIP_RATE), "mm s^-1"),
-    "APCP_surface": ((CSDMS_STD_NAME_RAIN_VOLUME_FLUX,), "kg m^-2"),
-    "DLWRF_surface": (("LWDOWN", CSDMS_STD_NAME_SOLAR_LONGWAVE), "W m-2"),
-    "DSWRF_surface": (("SWDOWN", CSDMS_STD_NAME_SOLAR_SHORTWAVE), "W m-2"),
-    "PRES_surface": (("PSFC", CSDMS_STD_NAME_SURFACE_AIR_PRESSURE), "Pa"),
-    "SPFH_2maboveground": (("Q2D", NGEN_STD_NAME_SPECIFIC_HUMIDITY), "kg kg-1"),
-    "TMP_2maboveground": (("T2D", CSDMS_STD_NAME_SURFACE_TEMP), "K"),
-    "UGRD_10maboveground": (("U2D", CSDMS_STD_NAME_WIND_U_X), "m s-1"),
-    "VGRD_10maboveground": (("V2D", CSDMS_STD_NAME_WIND_V_Y), "m s-1"),
-}
+# (name, aliases, unit)
+_aorc_forcing: tuple[tuple[str, tuple[str, ...], str], ...] = (
+    ("precip_rate", ("RAINRATE", CSDMS_STD_NAME_LIQUID_EQ_PRECIP_RATE), "mm s^-1"),
+    ("APCP_surface", (CSDMS_STD_NAME_RAIN_VOLUME_FLUX,), "kg m^-2"),
+    ("DLWRF_surface", ("LWDOWN", CSDMS_STD_NAME_SOLAR_LONGWAVE), "W m-2"),
+    ("DSWRF_surface", ("SWDOWN", CSDMS_STD_NAME_SOLAR_SHORTWAVE), "W m-2"),
+    ("PRES_surface", ("PSFC", CSDMS_STD_NAME_SURFACE_AIR_PRESSURE), "Pa"),
+    ("SPFH_2maboveground", ("Q2D", NGEN_STD_NAME_SPECIFIC_HUMIDITY), "kg kg-1"),
+    ("TMP_2maboveground", ("T2D", CSDMS_STD_NAME_SURFACE_TEMP), "K"),
+    ("UGRD_10maboveground", ("U2D", CSDMS_STD_NAME_WIND_U_X), "m s-1"),
+    ("VGRD_10maboveground", ("V2D", CSDMS_STD_NAME_WIND_V_Y), "m s-1"),
+)
 
-_cfe_vars: list[ModelVarDict] = [
-    {
-        "name": "atmosphere_water__liquid_equivalent_precipitation_rate",
-        "unit": "mm h-1",
-        "dtype": "double",
-        "type": "input",
-    },
-    {
-        "name": "water_potential_evaporation_flux",
-        "unit": "m s-1",
-        "dtype": "double",
-        "type": "input",
-    },
-    {"name": "ice_fraction_schaake", "unit": "m", "dtype": "double", "type": "input"},
-    {
-        "name": "ice_fraction_xinanjiang",
-        "unit": "none",
-        "dtype": "double",
-        "type": "input",
-    },
-    {
-        "name": "soil_moisture_profile",
-        "unit": "none",
-        "dtype": "double",
-        "type": "input",
-    },
-    {"name": "RAIN_RATE", "unit": "m", "dtype": "double", "type": "output"},
-    {"name": "GIUH_RUNOFF", "unit": "m", "dtype": "double", "type": "output"},
-    {"name": "INFILTRATION_EXCESS", "unit": "m", "dtype": "double", "type": "output"},
-    {"name": "DIRECT_RUNOFF", "unit": "m", "dtype": "double", "type": "output"},
-    {"name": "NASH_LATERAL_RUNOFF", "unit": "m", "dtype": "double", "type": "output"},
-    {
-        "name": "DEEP_GW_TO_CHANNEL_FLUX",
-        "unit": "m",
-        "dtype": "double",
-        "type": "output",
-    },
-    {"name": "SOIL_TO_GW_FLUX", "unit": "m", "dtype": "double", "type": "output"},
-    {"name": "Q_OUT", "unit": "m", "dtype": "double", "type": "output"},
-    {"name": "POTENTIAL_ET", "unit": "m", "dtype": "double", "type": "output"},
-    {"name": "ACTUAL_ET", "unit": "m", "dtype": "double", "type": "output"},
-    {"name": "GW_STORAGE", "unit": "m", "dtype": "double", "type": "output"},
-    {"name": "SOIL_STORAGE", "unit": "m", "dtype": "double", "type": "output"},
-    {"name": "SOIL_STORAGE_CHANGE", "unit": "m", "dtype": "double", "type": "output"},
-    {"name": "SURF_RUNOFF_SCHEME", "unit": "none", "dtype": "int", "type": "output"},
-    {"name": "NWM_PONDED_DEPTH", "unit": "m", "dtype": "double", "type": "output"},
-]
-
-_topmodel_vars: list[ModelVarDict] = [
-    {
-        "name": "atmosphere_water__liquid_equivalent_precipitation_rate",
-        "unit": "m h-1",
-        "dtype": "double",
-        "type": "input",
-    },
-    {
-        "name": "water_potential_evaporation_flux",
-        "unit": "m h-1",
-        "dtype": "double",
-        "type": "input",
-    },
-    {"name": "Qout", "unit": "m h-1", "dtype": "double", "type": "output"},
-    {
-        "name": "atmosphere_water__liquid_equivalent_precipitation_rate_out",
-        "unit": "m h-1",
-        "dtype": "double",
-        "type": "output",
-    },
-    {
-        "name": "water_potential_evaporation_flux_out",
-        "unit": "m h-1",
-        "dtype": "double",
-        "type": "output",
-    },
-    {
-        "name": "land_surface_water__runoff_mass_flux",
-        "unit": "m h-1",
-        "dtype": "double",
-        "type": "output",
-    },
-    {
-        "name": "soil_water_root-zone_unsat-zone_top__recharge_volume_flux",
-        "unit": "m h-1",
-        "dtype": "double",
-        "type": "output",
-    },
-    {
-        "name": "land_surface_water__baseflow_volume_flux",
-        "unit": "m h-1",
-        "dtype": "double",
-        "type": "output",
-    },
-    {
-        "name": "soil_water__domain_volume_deficit",
-        "unit": "m",
-        "dtype": "double",
-        "type": "output",
-    },
-    {
-        "name": "land_surface_water__domain_time_integral_of_overland_flow_volume_flux",
-        "unit": "m h-1",
-        "dtype": "double",
-        "type": "output",
-    },
-    {
-        "name": "land_surface_water__domain_time_integral_of_precipitation_volume_flux",
-        "unit": "m",
-        "dtype": "double",
-        "type": "output",
-    },
-    {
-        "name": "land_surface_water__domain_time_integral_of_evaporation_volume_flux",
-        "unit": "m",
-        "dtype": "double",
-        "type": "output",
-    },
-    {
-        "name": "land_surface_water__domain_time_integral_of_runoff_volume_flux",
-        "unit": "m",
-        "dtype": "double",
-        "type": "output",
-    },
-    {
-        "name": "soil_water__domain_root-zone_volume_deficit",
-        "unit": "m",
-        "dtype": "double",
-        "type": "output",
-    },
-    {
-        "name": "soil_water__domain_unsaturated-zone_volume",
-        "unit": "m",
-        "dtype": "double",
-        "type": "output",
-    },
-    {
-        "name": "land_surface_water__water_balance_volume",
-        "unit": "m",
-        "dtype": "double",
-        "type": "output",
-    },
-]
-
-_nom_vars: list[ModelVarDict] = [
-    {"name": "SFCPRS", "unit": "Pa", "dtype": "double", "type": "input"},
-    {"name": "SFCTMP", "unit": "K", "dtype": "double", "type": "input"},
-    {"name": "SOLDN", "unit": "W/m2", "dtype": "double", "type": "input"},
-    {"name": "LWDN", "unit": "W/m2", "dtype": "double", "type": "input"},
-    {"name": "UU", "unit": "m/s", "dtype": "double", "type": "input"},
-    {"name": "VV", "unit": "m/s", "dtype": "double", "type": "input"},
-    {"name": "Q2", "unit": "kg/kg", "dtype": "double", "type": "input"},
-    {"name": "PRCPNONC", "unit": "mm/s", "dtype": "double", "type": "input"},
-    {"name": "QINSUR", "unit": "m/s", "dtype": "double", "type": "output"},
-    {"name": "ETRAN", "unit": "mm", "dtype": "double", "type": "output"},
-    {"name": "QSEVA", "unit": "mm/s", "dtype": "double", "type": "output"},
-    {"name": "EVAPOTRANS", "unit": "m/s", "dtype": "double", "type": "output"},
-    {"name": "TG", "unit": "K", "dtype": "double", "type": "output"},
-    {"name": "SNEQV", "unit": "mm", "dtype": "double", "type": "output"},
-    {"name": "TGS", "unit": "K", "dtype": "double", "type": "output"},
-    {"name": "ACSNOM", "unit": "mm", "dtype": "double", "type": "output"},
-    {"name": "SNOWT_AVG", "unit": "K", "dtype": "double", "type": "output"},
-    {"name": "ISNOW", "unit": "unitless", "dtype": "int", "type": "output"},
-    {"name": "QRAIN", "unit": "mm/s", "dtype": "double", "type": "output"},
-    {"name": "FSNO", "unit": "unitless", "dtype": "double", "type": "output"},
-    {"name": "SNOWH", "unit": "m", "dtype": "double", "type": "output"},
-    {"name": "SNLIQ", "unit": "mm", "dtype": "double", "type": "output"},
-    {"name": "QSNOW", "unit": "mm/s", "dtype": "double", "type": "output"},
-    {"name": "ECAN", "unit": "mm", "dtype": "double", "type": "output"},
-    {"name": "GH", "unit": "W/m-2", "dtype": "double", "type": "output"},
-    {"name": "TRAD", "unit": "K", "dtype": "double", "type": "output"},
-    {"name": "FSA", "unit": "W/m-2", "dtype": "double", "type": "output"},
-    {"name": "CMC", "unit": "mm", "dtype": "double", "type": "output"},
-    {"name": "LH", "unit": "W/m-2", "dtype": "double", "type": "output"},
-    {"name": "FIRA", "unit": "W/m-2", "dtype": "double", "type": "output"},
-    {"name": "FSH", "unit": "W/m-2", "dtype": "double", "type": "output"},
-]
+_cfe_vars: tuple[ModelVarT, ...] = (
+    ModelVarT(
+        "atmosphere_water__liquid_equivalent_precipitation_rate",
+        "mm h-1",
+        "double",
+        "input",
+    ),
+    ModelVarT("water_potential_evaporation_flux", "m s-1", "double", "input"),
+    ModelVarT("ice_fraction_schaake", "m", "double", "input"),
+    ModelVarT("ice_fraction_xinanjiang", "none", "double", "input"),
+    ModelVarT("soil_moisture_profile", "none", "double", "input"),
+    ModelVarT("RAIN_RATE", "m", "double", "output"),
+    ModelVarT("GIUH_RUNOFF", "m", "double", "output"),
+    ModelVarT("INFILTRATION_EXCESS", "m", "double", "output"),
+    ModelVarT("DIRECT_RUNOFF", "m", "double", "output"),
+    ModelVarT("NASH_LATERAL_RUNOFF", "m", "double", "output"),
+    ModelVarT("DEEP_GW_TO_CHANNEL_FLUX", "m", "double", "output"),
+    ModelVarT("SOIL_TO_GW_FLUX", "m", "double", "output"),
+    ModelVarT("Q_OUT", "m", "double", "output"),
+    ModelVarT("POTENTIAL_ET", "m", "double", "output"),
+    ModelVarT("ACTUAL_ET", "m", "double", "output"),
+    ModelVarT("GW_STORAGE", "m", "double", "output"),
+    ModelVarT("SOIL_STORAGE", "m", "double", "output"),
+    ModelVarT("SOIL_STORAGE_CHANGE", "m", "double", "output"),
+    ModelVarT("SURF_RUNOFF_SCHEME", "none", "int", "output"),
+    ModelVarT("NWM_PONDED_DEPTH", "m", "double", "output"),
+)
+
+_topmodel_vars: tuple[ModelVarT, ...] = (
+    ModelVarT(
+        "atmosphere_water__liquid_equivalent_precipitation_rate",
+        "m h-1",
+        "double",
+        "input",
+    ),
+    ModelVarT("water_potential_evaporation_flux", "m h-1", "double", "input"),
+    ModelVarT("Qout", "m h-1", "double", "output"),
+    ModelVarT(
+        "atmosphere_water__liquid_equivalent_precipitation_rate_out",
+        "m h-1",
+        "double",
+        "output",
+    ),
+    ModelVarT("water_potential_evaporation_flux_out", "m h-1", "double", "output"),
+    ModelVarT("land_surface_water__runoff_mass_flux", "m h-1", "double", "output"),
+    ModelVarT(
+        "soil_water_root-zone_unsat-zone_top__recharge_volume_flux",
+        "m h-1",
+        "double",
+        "output",
+    ),
+    ModelVarT("land_surface_water__baseflow_volume_flux", "m h-1", "double", "output"),
+    ModelVarT("soil_water__domain_volume_deficit", "m", "double", "output"),
+    ModelVarT(
+        "land_surface_water__domain_time_integral_of_overland_flow_volume_flux",
+        "m h-1",
+        "double",
+        "output",
+    ),
+    ModelVarT(
+        "land_surface_water__domain_time_integral_of_precipitation_volume_flux",
+        "m",
+        "double",
+        "output",
+    ),
+    ModelVarT(
+        "land_surface_water__domain_time_integral_of_evaporation_volume_flux",
+        "m",
+        "double",
+        "output",
+    ),
+    ModelVarT(
+        "land_surface_water__domain_time_integral_of_runoff_volume_flux",
+        "m",
+        "double",
+        "output",
+    ),
+    ModelVarT("soil_water__domain_root-zone_volume_deficit", "m", "double", "output"),
+    ModelVarT("soil_water__domain_unsaturated-zone_volume", "m", "double", "output"),
+    ModelVarT("land_surface_water__water_balance_volume", "m", "double", "output"),
+)
+
+_nom_vars: tuple[ModelVarT, ...] = (
+    ModelVarT("SFCPRS", "Pa", "double", "input"),
+    ModelVarT("SFCTMP", "K", "double", "input"),
+    ModelVarT("SOLDN", "W/m2", "double", "input"),
+    ModelVarT("LWDN", "W/m2", "double", "input"),
+    ModelVarT("UU", "m/s", "double", "input"),
+    ModelVarT("VV", "m/s", "double", "input"),
+    ModelVarT("Q2", "kg/kg", "double", "input"),
+    ModelVarT("PRCPNONC", "mm/s", "double", "input"),
+    ModelVarT("QINSUR", "m/s", "double", "output"),
+    ModelVarT("ETRAN", "mm", "double", "output"),
+    ModelVarT("QSEVA", "mm/s", "double", "output"),
+    ModelVarT("EVAPOTRANS", "m/s", "double", "output"),
+    ModelVarT("TG", "K", "double", "output"),
+    ModelVarT("SNEQV", "mm", "double", "output"),
+    ModelVarT("TGS", "K", "double", "output"),
+    ModelVarT("ACSNOM", "mm", "double", "output"),
+    ModelVarT("SNOWT_AVG", "K", "double", "output"),
+    ModelVarT("ISNOW", "unitless", "int", "output"),
+    ModelVarT("QRAIN", "mm/s", "double", "output"),
+    ModelVarT("FSNO", "unitless", "double", "output"),
+    ModelVarT("SNOWH", "m", "double", "output"),
+    ModelVarT("SNLIQ", "mm", "double", "output"),
+    ModelVarT("QSNOW", "mm/s", "double", "output"),
+    ModelVarT("ECAN", "mm", "double", "output"),
+    ModelVarT("GH", "W/m-2", "double", "output"),
+    ModelVarT("TRAD", "K", "double", "output"),
+    ModelVarT("FSA", "W/m-2", "double", "output"),
+    ModelVarT("CMC", "mm", "double", "output"),
+    ModelVarT("LH", "W/m-2", "double", "output"),
+    ModelVarT("FIRA", "W/m-2", "double", "output"),
+    ModelVarT("FSH", "W/m-2", "double", "output"),
+)
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import io
 import pathlib
+import re
 import typing
 from datetime import datetime
 
@@ -45,6 +47,14 @@ class SacSma(serde.NamelistSerializerDeserializer):
         if isinstance(value, datetime):
             return value
         elif isinstance(value, str):
+            # fast path for the common YYYYMMDDHH form; skips `strptime`'s format parsing
+            if len(value) == 10 and value.isdigit():
+                try:
+                    return datetime(
+                        int(value[0:4]), int(value[4:6]), int(value[6:8]), int(value[8:10])
+                    )
+                except ValueError:
+                    pass
             try:
                 return datetime.strptime(value, "%Y%m%d%H")
             except ValueError as e1:
@@ -68,8 +78,14 @@ class SacSma(serde.NamelistSerializerDeserializer):
 
     @typing_extensions.override
     def to_namelist_str(self) -> str:
-        o = _SacSmaWrapper(sac_control=_SacSmaNgenDefaults.parse_obj(self))
-        d = o.dict(by_alias=True)
+        # `self` is already validated; `construct` just fills in the ngen defaults
+        # rather than re-running every validator
+        sac_control = _SacSmaNgenDefaults.construct(
+            _fields_set=self.__fields_set__, **{**_SAC_SMA_NGEN_DEFAULTS, **self.__dict__}
+        )
+        # equivalent to `_SacSmaWrapper(sac_control=sac_control).dict(by_alias=True)`,
+        # without the wrapper swapping its type serializers onto the nested model's `Config`
+        d = {"sac_control": sac_control.dict(by_alias=True)}
         return format_serializers.to_namelist_str(d)
 
     @typing_extensions.override
@@ -114,10 +130,48 @@ class _SacSmaNgenDefaults(SacSma):
         }
 
 
+# `construct` deep copies each missing default (e.g. the `Path`s) on every call.
+# the defaults are immutable, so pass them in from a dict built once.
+_SAC_SMA_NGEN_DEFAULTS = {
+    name: field.default
+    for name, field in _SacSmaNgenDefaults.__fields__.items()
+    if name not in SacSma.__fields__
+}
+
+
 class _SacSmaWrapper(serde.NamelistSerializerDeserializer):
     sac_control: _SacSmaNgenDefaults
 
 
+# in the order they are written
+_SAC_SMA_PARAMS_FIELDS = (
+    "hru_area",
+    "uztwm",
+    "uzfwm",
+    "lztwm",
+    "lzfpm",
+    "lzfsm",
+    "adimp",
+    "uzk",
+    "lzpk",
+    "lzsk",
+    "zperc",
+    "rexp",
+    "pctim",
+    "pfree",
+    "riva",
+    "side",
+    "rserv",
+)
+_SAC_SMA_PARAMS_FIELD_SET = frozenset(_SAC_SMA_PARAMS_FIELDS)
+# `SacSmaParams.to_str` format string, e.g. "hru_id ngen.config_gen\nhru_area {hru_area}\n..."
+_SAC_SMA_PARAMS_TEMPLATE = "\n".join(
+    ["hru_id ngen.config_gen", *(f"{field} {{{field}}}" for field in _SAC_SMA_PARAMS_FIELDS)]
+)
+# `<field> <value>` line, fields are whitespace separated
+_SAC_SMA_PARAMS_LINE = re.compile(r"^[ \t]*(\S+)[ \t]+(\S+)[ \t\r]*$", re.MULTILINE)
+
+
 # NOTE: this is not a general sac-sma config file parser.
 #       it only parses sac-sma config files usable in ngen
 class SacSmaParams(serde.GenericSerializerDeserializer):
@@ -142,74 +196,35 @@ class SacSmaParams(serde.GenericSerializerDeserializer):
     @typing_extensions.override
     @classmethod
     def parse_obj(cls: type[Self], obj: Any) -> Self:
+        # common case, skip probing for a reader
+        if isinstance(obj, dict):
+            return super().parse_obj(obj)
         if (r := _maybe_into_readliner(obj)) is not None:
             return cls._parse(r)
         return super().parse_obj(obj)
 
     @classmethod
     def _parse(cls, reader: _Readliner) -> Self:
-        def parse_float(field: str, value: str) -> float:
-            try:
-                return float(value)
-            except BaseException as e:
-                raise ValueError(
-                    f"could not parse field: {field!r}, got {value}"
-                ) from e
-
         data = {}
-        fields = {
-            "hru_area",
-            "uztwm",
-            "uzfwm",
-            "lztwm",
-            "lzfpm",
-            "lzfsm",
-            "adimp",
-            "uzk",
-            "lzpk",
-            "lzsk",
-            "zperc",
-            "rexp",
-            "pctim",
-            "pfree",
-            "riva",
-            "side",
-            "rserv",
-        }
-        count = 0
-        while (line := reader.readline()) != "":
-            field, value = line.split(" ")
-            if field in fields:
-                value = parse_float(field, value)
-                data[field] = value
-                count += 1
-
-        if count != len(fields):
-            missing = ",".join(fields.difference(data.keys()))
+        text = "".join(iter(reader.readline, ""))
+        for m in _SAC_SMA_PARAMS_LINE.finditer(text):
+            field, value = m.group(1, 2)
+            if field in _SAC_SMA_PARAMS_FIELD_SET:
+                try:
+                    data[field] = float(value)
+                except (ValueError, TypeError) as e:
+                    raise ValueError(
+                        f"could not parse field: {field!r}, got {value}"
+                    ) from e
+
+        if len(data) != len(_SAC_SMA_PARAMS_FIELDS):
+            missing = ",".join(f for f in _SAC_SMA_PARAMS_FIELDS if f not in data)
             raise RuntimeError(f"missing fields: {missing}")
         return cls(**data)
 
     @typing_extensions.override
     def to_str(self, *_) -> str:
-        s = f"""hru_id ngen.config_gen
-hru_area {self.hru_area}
-uztwm {self.uztwm}
-uzfwm {self.uzfwm}
-lztwm {self.lztwm}
-lzfpm {self.lzfpm}
-lzfsm {self.lzfsm}
-adimp {self.adimp}
-uzk {self.uzk}
-lzpk {self.lzpk}
-lzsk {self.lzsk}
-zperc {self.zperc}
-rexp {self.rexp}
-pctim {self.pctim}
-pfree {self.pfree}
-riva {self.riva}
-side {self.side}
-rserv {self.rserv}"""
-        return s
+        return _SAC_SMA_PARAMS_TEMPLATE.format_map(self.__dict__)
 
     @typing_extensions.override
     def to_file(self, p: pathlib.Path, *_) -> None:
@@ -218,12 +233,13 @@ rserv {self.rserv}"""
     @typing_extensions.override
     @classmethod
     def from_str(cls, s: str, *_) -> Self:
-        return cls.parse_obj(s)
+        return cls._parse(io.StringIO(s))
 
     @typing_extensions.override
     @classmethod
     def from_file(cls, p: pathlib.Path, *_) -> Self:
-        return cls.parse_file(p)
+        with p.open() as fp:
+            return cls._parse(fp)
 
 
 SacSma.update_forward_refs()
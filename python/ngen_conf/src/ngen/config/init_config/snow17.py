@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 import pathlib
 import typing
 from datetime import datetime
@@ -21,6 +22,14 @@ if typing.TYPE_CHECKING:
     from typing import Any, Self
 
 
+_DEV_NULL = pathlib.Path("/dev/null")
+
+
+def _serialize_datehr(d: datetime) -> int:
+    # YYYYMMDDHH
+    return d.year * 1_000_000 + d.month * 10_000 + d.day * 100 + d.hour
+
+
 # NOTE: this is not a general snow17 config file parser.
 #       it only parses snow17 config files usable in ngen
 # NOTE: update_forward_refs() call at bottom of file
@@ -40,12 +49,23 @@ class Snow17(serde.NamelistSerializerDeserializer):
 
     @validator("start_datehr", "end_datehr", pre=True)
     def _validate_datetime(cls, value: datetime | str | int) -> datetime:
+        # exact type check; e.g. re-validating an existing `Snow17`
+        if type(value) is datetime:
+            return value
         if isinstance(value, int):
             value = str(value)
 
         if isinstance(value, datetime):
             return value
         elif isinstance(value, str):
+            # fast path for the common YYYYMMDDHH form; skips `strptime`'s format parsing
+            if len(value) == 10 and value.isdigit():
+                try:
+                    return datetime(
+                        int(value[0:4]), int(value[4:6]), int(value[6:8]), int(value[8:10])
+                    )
+                except ValueError:
+                    pass
             try:
                 return datetime.strptime(value, "%Y%m%d%H")
             except ValueError as e1:
@@ -62,15 +82,25 @@ class Snow17(serde.NamelistSerializerDeserializer):
 
     class Config(serde.NamelistSerializerDeserializer.Config):
         field_serializers = {
-            "snow17_param_file": lambda f: str(f),
-            "start_datehr": lambda d: int(d.strftime("%Y%m%d%H")),
-            "end_datehr": lambda d: int(d.strftime("%Y%m%d%H")),
+            "snow17_param_file": str,
+            "start_datehr": _serialize_datehr,
+            "end_datehr": _serialize_datehr,
         }
+        # instances are only read when (de)serialized; share rather than copy an
+        # already valid instance when it is assigned to a field of another model.
+        # inherited by `_Snow17NgenDefaults`
+        copy_on_model_validation = "none"
 
     @typing_extensions.override
     def to_namelist_str(self) -> str:
-        o = _Snow17Wrapper(snow17_control=_Snow17NgenDefaults.parse_obj(self))
-        d = o.dict(by_alias=True)
+        # `self` is already validated; `construct` just fills in the ngen defaults
+        # rather than re-running every validator
+        snow17_control = _Snow17NgenDefaults.construct(
+            _fields_set=self.__fields_set__, **{**_SNOW17_NGEN_DEFAULTS, **self.__dict__}
+        )
+        # equivalent to `_Snow17Wrapper(snow17_control=snow17_control).dict(by_alias=True)`,
+        # without the wrapper swapping its type serializers onto the nested model's `Config`
+        d = {"snow17_control": snow17_control.dict(by_alias=True)}
         return format_serializers.to_namelist_str(d)
 
     @typing_extensions.override
@@ -95,29 +125,73 @@ class Snow17(serde.NamelistSerializerDeserializer):
 class _Snow17NgenDefaults(Snow17):
     main_id: str = "ngen.config_gen"
     n_hrus: int = 1  # 1 for ngen
-    forcing_root: pathlib.Path = pathlib.Path("/dev/null")
-    output_root: pathlib.Path = pathlib.Path("/dev/null")
-    snow_state_out_root: pathlib.Path = pathlib.Path("/dev/null")
-    snow_state_in_root: pathlib.Path = pathlib.Path("/dev/null")
+    forcing_root: pathlib.Path = _DEV_NULL
+    output_root: pathlib.Path = _DEV_NULL
+    snow_state_out_root: pathlib.Path = _DEV_NULL
+    snow_state_in_root: pathlib.Path = _DEV_NULL
     output_hrus: bool = False
     warm_start_run: bool = False
     write_states: bool = False
 
     class Config(Snow17.Config):
         field_serializers = {
-            "forcing_root": lambda f: str(f),
-            "output_root": lambda f: str(f),
-            "snow_state_out_root": lambda f: str(f),
-            "snow_state_in_root": lambda f: str(f),
-            "output_hrus": lambda b: int(b),
-            "warm_start_run": lambda b: int(b),
-            "write_states": lambda b: int(b),
+            "forcing_root": str,
+            "output_root": str,
+            "snow_state_out_root": str,
+            "snow_state_in_root": str,
+            "output_hrus": int,
+            "warm_start_run": int,
+            "write_states": int,
         }
 
 
+# `construct` deep copies each missing default (e.g. the `Path`s) on every call.
+# the defaults are immutable, so pass them in from a dict built once.
+_SNOW17_NGEN_DEFAULTS = {
+    name: field.default
+    for name, field in _Snow17NgenDefaults.__fields__.items()
+    if name not in Snow17.__fields__
+}
+
+
 class _Snow17Wrapper(serde.NamelistSerializerDeserializer):
     snow17_control: _Snow17NgenDefaults
 
+    class Config(serde.NamelistSerializerDeserializer.Config):
+        copy_on_model_validation = "none"
+
+
+# in the order they are written, followed by `adc{1..=11}`
+_SNOW17_PARAMS_FIELDS = (
+    "hru_area",
+    "latitude",
+    "elev",
+    "scf",
+    "mfmax",
+    "mfmin",
+    "uadj",
+    "si",
+    "pxtemp",
+    "nmf",
+    "tipm",
+    "mbase",
+    "plwhc",
+    "daygm",
+)
+_SNOW17_PARAMS_FIELD_SET = frozenset(_SNOW17_PARAMS_FIELDS)
+# NOTE: account for fortran indexing; `adc1` is `adc[0]`
+_SNOW17_PARAMS_ADC_INDEX = {f"adc{i + 1}": i for i in range(11)}
+_SNOW17_PARAMS_ADC_ALL = (1 << 11) - 1
+# `Snow17Params.to_str` format string,
+# e.g. "hru_id ngen.config_gen\nhru_area {hru_area}\n...\nadc1 {adc[0]}\n..."
+_SNOW17_PARAMS_TEMPLATE = "\n".join(
+    [
+        "hru_id ngen.config_gen",
+        *(f"{field} {{{field}}}" for field in _SNOW17_PARAMS_FIELDS),
+        *(f"{adc} {{adc[{i}]}}" for adc, i in _SNOW17_PARAMS_ADC_INDEX.items()),
+    ]
+)
+
 
 # NOTE: this is not a general snow17 config file parser.
 #       it only parses snow17 config files usable in ngen
@@ -138,9 +212,18 @@ class Snow17Params(serde.GenericSerializerDeserializer):
     daygm: float = Field(units="mm / day")
     adc: list[float] = Field(min_items=11, max_items=11, units=CommonUnits.Dimensionless)
 
+    class Config(serde.GenericSerializerDeserializer.Config):
+        # `PathPair` re-validates its inner `Snow17Params` each time a `Snow17` is
+        # validated (e.g. `from_namelist_str`). the instance is already valid; share
+        # it rather than copying it.
+        copy_on_model_validation = "none"
+
     @typing_extensions.override
     @classmethod
     def parse_obj(cls: type[Self], obj: Any) -> Self:
+        # common case, skip probing for a reader
+        if isinstance(obj, dict):
+            return super().parse_obj(obj)
         if (r := _maybe_into_readliner(obj)) is not None:
             return cls._parse(r)
         return super().parse_obj(obj)
@@ -150,76 +233,41 @@ class Snow17Params(serde.GenericSerializerDeserializer):
         def parse_float(field: str, value: str) -> float:
             try:
                 return float(value)
-            except BaseException as e:
+            except (ValueError, TypeError) as e:
                 raise ValueError(
                     f"could not parse field: {field!r}, got {value}"
                 ) from e
 
         data = {}
-        fields = {
-            "hru_area",
-            "latitude",
-            "elev",
-            "scf",
-            "mfmax",
-            "mfmin",
-            "uadj",
-            "si",
-            "pxtemp",
-            "nmf",
-            "tipm",
-            "mbase",
-            "plwhc",
-            "daygm",
-            # "adc{1..=11}", # NOTE: handled separately
-        }
-        count = 0
         adc: list[float] = [0.0] * 11
-        while (line := reader.readline()) != "":
-            field, value = line.split(" ")
-
-            if field.startswith("adc"):
-                value = parse_float(field, value)
-                # NOTE: account for fortran indexing
-                idx = int(field[len("adc") :]) - 1
-                adc[idx] = value
-            elif field in fields:
-                value = parse_float(field, value)
-                data[field] = value
-            else:
+        # bit `i` is set once `adc[i]` is parsed
+        adc_seen = 0
+        text = "".join(iter(reader.readline, ""))
+        for line in text.splitlines():
+            field, sep, value = line.partition(" ")
+            if not sep:
                 continue
-            count += 1
 
-        # NOTE: expected 11 adc values
-        if count != len(fields) + 11:
-            missing = ",".join(fields.difference(data.keys()))
+            if (idx := _SNOW17_PARAMS_ADC_INDEX.get(field)) is not None:
+                adc[idx] = parse_float(field, value)
+                adc_seen |= 1 << idx
+            elif field in _SNOW17_PARAMS_FIELD_SET:
+                data[field] = parse_float(field, value)
+
+        if len(data) != len(_SNOW17_PARAMS_FIELDS) or adc_seen != _SNOW17_PARAMS_ADC_ALL:
+            missing = ",".join(
+                [
+                    *(f for f in _SNOW17_PARAMS_FIELDS if f not in data),
+                    *(f"adc{i + 1}" for i in range(11) if not adc_seen & (1 << i)),
+                ]
+            )
             raise RuntimeError(f"missing fields: {missing}")
         data["adc"] = adc
         return cls(**data)
 
     @typing_extensions.override
     def to_str(self, *_) -> str:
-        # NOTE: account for fortran indexing
-        adc_values = "\n".join(
-            f"adc{i + 1} {value}" for i, value in enumerate(self.adc)
-        )
-        s = f"""hru_id ngen.config_gen
-hru_area {self.hru_area}
-latitude {self.latitude}
-elev {self.elev}
-scf {self.scf}
-mfmax {self.mfmax}
-mfmin {self.mfmin}
-uadj {self.uadj}
-si {self.si}
-pxtemp {self.pxtemp}
-nmf {self.nmf}
-tipm {self.tipm}
-mbase {self.mbase}
-plwhc {self.plwhc}
-daygm {self.daygm}
-{adc_values}"""
-        return s
+        return _SNOW17_PARAMS_TEMPLATE.format_map(self.__dict__)
 
     @typing_extensions.override
     def to_file(self, p: pathlib.Path, *_) -> None:
@@ -228,12 +276,13 @@ daygm {self.daygm}
     @typing_extensions.override
     @classmethod
     def from_str(cls, s: str, *_) -> Self:
-        return cls.parse_obj(s)
+        return cls._parse(io.StringIO(s))
 
     @typing_extensions.override
     @classmethod
     def from_file(cls, p: pathlib.Path, *_) -> Self:
-        return cls.parse_file(p)
+        with p.open() as fp:
+            return cls._parse(fp)
 
 
 Snow17.update_forward_refs()
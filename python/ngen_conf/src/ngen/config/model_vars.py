@@ -54,6 +54,9 @@ class ModelMeta(typing_extensions.Protocol):
     The name of a BMI module and it's inputs and outputs
     """
 
+    # allow implementations to define `__slots__`
+    __slots__ = ()
+
     def name(self) -> str:
         ...
 
@@ -4,6 +4,7 @@ import warnings
 
 import pytest
 from ngen.init_config import utils
+from ngen.init_config.deserializer import from_namelist_str
 
 from ngen.config.init_config.cfe import CFE
 from ngen.config.init_config.casam import Casam
@@ -12,8 +13,8 @@ from ngen.config.init_config.pet import PET
 from ngen.config.init_config.soil_freeze_thaw import SoilFreezeThaw
 from ngen.config.init_config.soil_moisture_profile import SoilMoistureProfile
 from ngen.config.init_config.topmodel import Topmodel, TopModelSubcat, TopModelParams
-from ngen.config.init_config.snow17 import Snow17, Snow17Params
-from ngen.config.init_config.sacsma import SacSma, SacSmaParams
+from ngen.config.init_config.snow17 import Snow17, Snow17Params, _Snow17Wrapper
+from ngen.config.init_config.sacsma import SacSma, SacSmaParams, _SacSmaWrapper
 
 from typing import TYPE_CHECKING
 
@@ -210,14 +211,34 @@ def test_snow17(snow17_config: str):
     o = Snow17.from_namelist_str(snow17_config)
     assert o.to_namelist_str() == snow17_config
 
+def test_snow17_ngen_defaults_to_namelist_str(snow17_config: str):
+    o = from_namelist_str(snow17_config, _Snow17Wrapper).snow17_control
+    assert o.to_namelist_str() == snow17_config
+
 def test_snow17_params(snow17_params_config: str):
     o = Snow17Params.from_str(snow17_params_config)
     assert o.to_str() == snow17_params_config
 
+def test_snow17_params_from_file(snow17_params_config: str, tmp_path: Path):
+    p = tmp_path / "snow17_params.txt"
+    p.write_text(snow17_params_config)
+    o = Snow17Params.from_file(p)
+    assert o.to_str() == snow17_params_config
+
 def test_sacsma(sacsma_config: str):
     o = SacSma.from_namelist_str(sacsma_config)
     assert o.to_namelist_str() == sacsma_config
 
+def test_sacsma_ngen_defaults_to_namelist_str(sacsma_config: str):
+    o = from_namelist_str(sacsma_config, _SacSmaWrapper).sac_control
+    assert o.to_namelist_str() == sacsma_config
+
 def test_sacsma_params(sacsma_params_config: str):
     o = SacSmaParams.from_str(sacsma_params_config)
     assert o.to_str() == sacsma_params_config
+
+def test_sacsma_params_from_file(sacsma_params_config: str, tmp_path: Path):
+    p = tmp_path / "sacsma_params.txt"
+    p.write_text(sacsma_params_config)
+    o = SacSmaParams.from_file(p)
+    assert o.to_str() == sacsma_params_config